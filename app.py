@@ -15,17 +15,25 @@ import sys
 import sqlite3
 import csv
 import io
+import importlib.util
 import threading
+import functools
+import bisect
+import collections
+import queue
+import atexit
 import asyncio
 import aiohttp
 import concurrent.futures
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional, Any, Set, Tuple, Union
+from itertools import islice
 from urllib.parse import urlparse, urljoin, parse_qs
 from pathlib import Path
 import html
 import ssl
 import socket
+import logging
 
 # ============================================================================
 # IMPORTS WITH FALLBACKS & ENHANCED ERROR HANDLING
@@ -48,13 +56,13 @@ os.makedirs(CACHE_DIR, exist_ok=True)
 def check_and_install(package, import_name=None):
     """Check if package is installed, provide installation instructions"""
     import_name = import_name or package
-    try:
-        __import__(import_name)
+    # find_spec locates the package without importing it, so heavy
+    # libraries are only loaded where they are actually used
+    if importlib.util.find_spec(import_name) is not None:
         return True
-    except ImportError:
-        print(f"❌ Missing package: {package}")
-        print(f"   Install with: pip install {package}")
-        return False
+    print(f"❌ Missing package: {package}")
+    print(f"   Install with: pip install {package}")
+    return False
 
 REQUIRED_PACKAGES = [
     ('requests', 'requests'),
@@ -77,18 +85,14 @@ for package, import_name in REQUIRED_PACKAGES:
 
 # Now import everything
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import aiohttp
 import asyncio
 from typing import Optional
-import openpyxl
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
 import pydantic
 from pydantic import BaseModel, Field, validator
 from cryptography.fernet import Fernet
@@ -110,6 +114,62 @@ except ImportError:
     AUTOREFRESH_AVAILABLE = False
     print("⚠️  streamlit-autorefresh not installed. Auto-refresh disabled.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("⚠️  orjson not installed. Using standard json.")
+
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup tree builder
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    print("⚠️  lxml not installed. Using html.parser for HTML parsing.")
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    print("⚠️  pyahocorasick not installed. Using per-keyword page scans.")
+
+# BeautifulSoup backend: lxml's C parser is several times faster than html.parser
+HTML_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string (compact, or indented by 2), using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, default=str, indent=2)
+    return json.dumps(obj, default=str, separators=(',', ':'))
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class KeywordMatcher:
+    """Tests text for any of a fixed keyword set in one Aho-Corasick pass (per-keyword scans without pyahocorasick)"""
+    
+    def __init__(self, keywords: Tuple[str, ...]):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self.automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+    
+    def search(self, text: str) -> bool:
+        """Return True if any keyword occurs in text"""
+        if self.automaton is not None:
+            return next(self.automaton.iter(text), None) is not None
+        return any(keyword in text for keyword in self.keywords)
+
 # ============================================================================
 # ENHANCED CONFIGURATION WITH PYDANTIC VALIDATION
 # ============================================================================
@@ -327,9 +387,9 @@ class UltimateLeadScraperConfig(BaseModel):
     # Storage
     storage: Dict[str, str] = Field(
         default_factory=lambda: {
-            "leads_file": "data/leads.json",
-            "qualified_leads": "data/qualified_leads.json",
-            "premium_leads": "data/premium_leads.json",
+            "leads_file": "data/leads.jsonl",
+            "qualified_leads": "data/qualified_leads.jsonl",
+            "premium_leads": "data/premium_leads.jsonl",
             "logs_file": "logs/system.log",
             "cache_file": "cache/search_cache.json",
             "exports_dir": "exports",
@@ -368,20 +428,31 @@ class UltimateLeadScraperConfig(BaseModel):
             "cache_ttl": 3600,
             "enable_compression": True,
             "max_threads": 10,
+            "connection_limit": 100,
+            "connection_limit_per_host": 4,
+            "dns_cache_ttl": 300,
             "enable_proxies": False,
             "proxy_list": []
         }
     )
 
+# Digest of the config file as last read or written
+_saved_config_digest: Optional[bytes] = None
+
 def load_config() -> UltimateLeadScraperConfig:
     """Load configuration with validation"""
     # Load environment variables first
     load_dotenv()
     
+    global _saved_config_digest
+    
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, "r") as f:
-                config_data = json.load(f)
+            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+                raw_config = f.read()
+            config_data = json_loads(raw_config)
+            # Digest the re-serialized data so it compares like-for-like with save_config's json_dumps output
+            _saved_config_digest = config_digest(json_dumps(config_data, indent=True))
             
             # Merge with environment variables
             if os.getenv("SERPER_API_KEY"):
@@ -404,13 +475,36 @@ def load_config() -> UltimateLeadScraperConfig:
     print("📝 Created new configuration file")
     return config
 
-def save_config(config: UltimateLeadScraperConfig):
-    """Save configuration to file"""
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config.dict(), f, indent=2, default=str)
+def config_digest(payload: str) -> bytes:
+    """Digest of a serialized configuration, used to skip unchanged saves"""
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+def save_config(config: UltimateLeadScraperConfig) -> bool:
+    """Save configuration to file, skipping the write when nothing changed"""
+    global _saved_config_digest
+    
+    payload = json_dumps(config.dict(), indent=True)
+    digest = config_digest(payload)
+    if digest == _saved_config_digest and os.path.exists(CONFIG_FILE):
+        return False
+    
+    # Write a sibling temp file and swap it in, so an interrupted save never leaves a truncated config
+    temp_file = f"{CONFIG_FILE}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        f.write(payload)
+    os.replace(temp_file, CONFIG_FILE)
+    _saved_config_digest = digest
+    return True
 
 CONFIG = load_config()
 
+def refresh_ai_enrichment_status():
+    """Recompute whether AI enrichment can run after the API keys change"""
+    global AI_ENRICHMENT_ACTIVE
+    AI_ENRICHMENT_ACTIVE = bool(OPENAI_AVAILABLE and CONFIG.api.openai_api_key)
+
+refresh_ai_enrichment_status()
+
 # Ensure storage directories exist
 for dir_path in CONFIG.storage.values():
     if '/' in dir_path or '\\' in dir_path:
@@ -420,18 +514,46 @@ for dir_path in CONFIG.storage.values():
 # ENHANCED LOGGER WITH ROTATION AND MULTIPLE HANDLERS
 # ============================================================================
 
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line for cheap tail parsing"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage()
+        }
+        return json_dumps(entry)
+
 class EnhancedLogger:
     """Enhanced logger with file rotation, multiple handlers, and log levels"""
     
+    LEVELS = {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL
+    }
+    
+    CONSOLE_COLORS = {
+        "INFO": "\033[94m",
+        "SUCCESS": "\033[92m",
+        "WARNING": "\033[93m",
+        "ERROR": "\033[91m",
+        "DEBUG": "\033[90m"
+    }
+    
     def __init__(self):
         self.log_file = CONFIG.storage["logs_file"]
         self.max_file_size = 10 * 1024 * 1024  # 10 MB
         self.backup_count = 5
+        self.tail_bytes = 256 * 1024  # Only the end of the file is read for recent logs
         self.setup_logger()
     
     def setup_logger(self):
         """Setup logger with handlers"""
-        import logging
         from logging.handlers import RotatingFileHandler
         
         self.logger = logging.getLogger('UltimateLeadScraper')
@@ -452,12 +574,12 @@ class EnhancedLogger:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         
-        # Formatter
+        # Formatters: JSON lines for the file, plain text for the console
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(JsonLinesFormatter(datefmt='%Y-%m-%d %H:%M:%S'))
         console_handler.setFormatter(formatter)
         
         # Add handlers
@@ -466,32 +588,15 @@ class EnhancedLogger:
     
     def log(self, message: str, level: str = "INFO", extra: Dict = None):
         """Log message with specified level"""
-        log_methods = {
-            "DEBUG": self.logger.debug,
-            "INFO": self.logger.info,
-            "WARNING": self.logger.warning,
-            "ERROR": self.logger.error,
-            "CRITICAL": self.logger.critical
-        }
-        
-        log_method = log_methods.get(level.upper(), self.logger.info)
-        
         # Add extra context if provided
         if extra:
-            message = f"{message} | {json.dumps(extra)}"
+            message = f"{message} | {json_dumps(extra)}"
         
-        log_method(message)
+        # Appends one JSON line via the rotating file handler
+        self.logger.log(self.LEVELS.get(level.upper(), logging.INFO), message)
         
         # Also print colored output for console
-        colors = {
-            "INFO": "\033[94m",
-            "SUCCESS": "\033[92m",
-            "WARNING": "\033[93m",
-            "ERROR": "\033[91m",
-            "DEBUG": "\033[90m"
-        }
-        
-        color = colors.get(level, "\033[0m")
+        color = self.CONSOLE_COLORS.get(level, "\033[0m")
         timestamp = datetime.now().strftime("%H:%M:%S")
         print(f"{color}[{timestamp}] {level}: {message}\033[0m")
     
@@ -499,23 +604,35 @@ class EnhancedLogger:
         """Get recent logs"""
         logs = []
         try:
-            with open(self.log_file, 'r') as f:
-                lines = f.readlines()[-limit:]
-            
-            for line in lines:
+            # Tail-read: seek near the end instead of reading the whole (up to 10 MB) file
+            with open(self.log_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - self.tail_bytes))
+                lines = f.read().decode('utf-8', errors='replace').splitlines()
+            
+            # Drop the partial first line when the read started mid-file
+            if size > self.tail_bytes:
+                lines = lines[1:]
+            
+            for line in lines[-limit:]:
                 try:
-                    # Parse log line
-                    parts = line.split(' - ', 3)
-                    if len(parts) >= 4:
+                    if line.startswith('{'):
+                        log_entry = json_loads(line)
+                    else:
+                        # Plain-text line written before the switch to JSON lines
+                        parts = line.split(' - ', 3)
+                        if len(parts) < 4:
+                            continue
                         log_entry = {
                             "timestamp": parts[0],
                             "logger": parts[1],
                             "level": parts[2],
                             "message": parts[3].strip()
                         }
-                        
-                        if not level or log_entry["level"] == level.upper():
-                            logs.append(log_entry)
+                    
+                    if not level or log_entry["level"] == level.upper():
+                        logs.append(log_entry)
                 except:
                     continue
         except:
@@ -578,26 +695,160 @@ encryption_service = EncryptionService()
 # ENHANCED DATABASE WITH MIGRATIONS AND AUDIT LOG
 # ============================================================================
 
+class ReadOnlyConnection(sqlite3.Connection):
+    """SQLite connection opened with mode=ro, pooled separately from writers"""
+
 class UltimateCRM:
     """Enhanced SQLite CRM with migrations, audit log, and advanced features"""
     
+    # Lead fields that map straight onto leads table columns
+    LEAD_INSERT_COLUMNS = (
+        'fingerprint', 'business_name', 'website', 'website_status', 'phone', 'email',
+        'address', 'city', 'state', 'zip_code', 'country', 'industry', 'business_type',
+        'services', 'description', 'social_media', 'lead_score', 'quality_tier',
+        'potential_value', 'estimated_revenue', 'employee_count', 'years_in_business',
+        'decision_maker_name', 'decision_maker_title', 'decision_maker_email',
+        'decision_maker_phone', 'outreach_priority', 'lead_status', 'assigned_to',
+        'lead_source', 'scraped_date', 'google_business_url', 'facebook_business_url',
+        'yelp_business_url', 'bbb_business_url', 'other_platforms', 'notes', 'ai_notes',
+        'outreach_strategy'
+    )
+    # Fields update_lead may set; identity and system columns are left to the CRM itself
+    UPDATABLE_LEAD_COLUMNS = frozenset(LEAD_INSERT_COLUMNS).difference({'fingerprint'}).union({
+        'last_contacted', 'next_followup', 'lead_production_date',
+        'meeting_type', 'meeting_date', 'meeting_outcome'
+    })
+    SEARCH_COLUMNS = ('business_name', 'website', 'phone', 'email', 'city', 'industry')  # leads_fts columns
+    ACTIVITY_STAT_COLUMNS = {
+        "activity_count": "(SELECT COUNT(*) FROM activities a WHERE a.lead_id = p.id) as activity_count",
+        "last_activity_date": "(SELECT MAX(a.created_at) FROM activities a WHERE a.lead_id = p.id) as last_activity_date"
+    }
+    JSON_FIELDS = ('social_media', 'services', 'other_platforms')  # Stored as compact JSON text
+    LEAD_BATCH_SIZE = 500  # Rows per write transaction (stays under SQLite's 999 variable limit)
+    HTTP_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    
+    # get_statistics: every breakdown as (kind, label, count, score_sum, score_n, value_sum,
+    # new_leads, premium_leads) rows over one scan of the period's active leads
+    STATISTICS_QUERY = '''
+        WITH active AS (
+            SELECT lead_status, quality_tier, website_status, city, industry,
+                   lead_score, potential_value, DATE(created_at) as day
+            FROM leads
+            WHERE is_archived = 0 AND created_at >= DATE('now', ?)
+        )
+        SELECT 'status' as kind, lead_status as label, COUNT(*) as count, SUM(lead_score) as score_sum,
+               COUNT(lead_score) as score_n, SUM(potential_value) as value_sum,
+               COUNT(*) FILTER (WHERE lead_status = 'New Lead') as new_leads,
+               COUNT(*) FILTER (WHERE quality_tier IN ('Premium', 'High')) as premium_leads
+        FROM active GROUP BY lead_status
+        UNION ALL
+        SELECT 'quality', quality_tier, COUNT(*), SUM(lead_score), COUNT(lead_score), SUM(potential_value),
+               COUNT(*) FILTER (WHERE lead_status = 'New Lead'),
+               COUNT(*) FILTER (WHERE quality_tier IN ('Premium', 'High'))
+        FROM active GROUP BY quality_tier
+        UNION ALL
+        SELECT 'website', website_status, COUNT(*), SUM(lead_score), COUNT(lead_score), SUM(potential_value),
+               COUNT(*) FILTER (WHERE lead_status = 'New Lead'),
+               COUNT(*) FILTER (WHERE quality_tier IN ('Premium', 'High'))
+        FROM active GROUP BY website_status
+        UNION ALL
+        SELECT 'day', day, COUNT(*), SUM(lead_score), COUNT(lead_score), SUM(potential_value),
+               COUNT(*) FILTER (WHERE lead_status = 'New Lead'),
+               COUNT(*) FILTER (WHERE quality_tier IN ('Premium', 'High'))
+        FROM active GROUP BY day
+        UNION ALL
+        SELECT 'city', city, COUNT(*), SUM(lead_score), COUNT(lead_score), SUM(potential_value),
+               COUNT(*) FILTER (WHERE lead_status = 'New Lead'),
+               COUNT(*) FILTER (WHERE quality_tier IN ('Premium', 'High'))
+        FROM active GROUP BY city
+        UNION ALL
+        SELECT 'industry', industry, COUNT(*), SUM(lead_score), COUNT(lead_score), SUM(potential_value),
+               COUNT(*) FILTER (WHERE lead_status = 'New Lead'),
+               COUNT(*) FILTER (WHERE quality_tier IN ('Premium', 'High'))
+        FROM active GROUP BY industry
+    '''
+    INSERT_ACTIVITY_SQL = '''
+        INSERT INTO activities (lead_id, activity_type, activity_details)
+        VALUES (?, ?, ?)
+    '''
+    DAILY_STATISTICS_SELECT_SQL = '''
+        SELECT 
+            COUNT(*) as total_leads,
+            COUNT(*) FILTER (WHERE lead_status = 'New Lead') as new_leads,
+            COUNT(*) FILTER (WHERE lead_status = 'Contacted') as contacted_leads,
+            COUNT(*) FILTER (WHERE lead_status IN ('Meeting Scheduled', 'Zoom Meeting')) as meetings_scheduled,
+            COUNT(*) FILTER (WHERE lead_status = 'Closed (Won)') as closed_won,
+            COUNT(*) FILTER (WHERE lead_status = 'Closed (Lost)') as closed_lost,
+            COUNT(*) FILTER (WHERE quality_tier IN ('Premium', 'High')) as premium_leads,
+            SUM(potential_value) as estimated_value
+        FROM leads 
+        WHERE created_at >= DATE('now') AND is_archived = 0
+    '''
+    DAILY_STATISTICS_UPSERT_SQL = '''
+        INSERT INTO daily_statistics 
+        (stat_date, total_leads, new_leads, contacted_leads, meetings_scheduled, 
+         closed_won, closed_lost, premium_leads, estimated_value)
+        VALUES (DATE('now'), ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(stat_date) DO UPDATE SET
+            total_leads = excluded.total_leads,
+            new_leads = excluded.new_leads,
+            contacted_leads = excluded.contacted_leads,
+            meetings_scheduled = excluded.meetings_scheduled,
+            closed_won = excluded.closed_won,
+            closed_lost = excluded.closed_lost,
+            premium_leads = excluded.premium_leads,
+            estimated_value = excluded.estimated_value,
+            updated_at = CURRENT_TIMESTAMP
+    '''
+    WRITER_LINGER_SECONDS = 0.2  # How long the writer waits for more batches to join a transaction
+    STATISTICS_REFRESH_SECONDS = 60
+    OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+    CHECKPOINT_INTERVAL_SECONDS = 24 * 60 * 60
+    CACHED_STATEMENTS = 256  # Per-connection prepared statement cache (sqlite3 default is 128)
+    QUALITY_TIER_ORDER = {'Premium': 1, 'High': 2, 'Medium': 3, 'Low': 4}
+    FUNNEL_STAGE_ORDER = {
+        'New Lead': 1, 'Contacted': 2, 'Follow Up': 3, 'Meeting Scheduled': 4,
+        'Zoom Meeting': 5, 'Closed (Won)': 6, 'Closed (Lost)': 7
+    }
+    
     def __init__(self):
         self.db_file = CONFIG.crm.database
         self.conn = None
         self.cursor = None
         self.migration_version = 4  # Current schema version
+        self.pool_size = 8
+        self.pool = queue.LifoQueue(maxsize=self.pool_size)  # Idle, already-tuned connections
+        self.read_pool = queue.LifoQueue(maxsize=self.pool_size)  # Idle read-only connections
+        self.fingerprints = {}  # fingerprint -> lead id for every stored lead (archived ones keep theirs)
+        self.fingerprint_lock = threading.Lock()
+        self.stats_dirty = threading.Event()  # Leads saved since daily statistics were last refreshed
+        self.stop_event = threading.Event()
+        self.search_fts = False  # True once the leads_fts trigram index is available
+        self.lead_columns = frozenset()  # Column names of the leads table, the get_leads whitelist
+        self.http = self.create_http_session()
         self.setup_database()
+        
+        # Statistics, PRAGMA optimize and WAL checkpoints run off the save path
+        self.maintenance_thread = threading.Thread(
+            target=self.run_maintenance, name="crm-maintenance", daemon=True
+        )
+        self.maintenance_thread.start()
+        
+        # Queued lead batches are coalesced and written by one thread
+        self.write_queue = queue.Queue()
+        self.writer_thread = threading.Thread(target=self.run_writer, name="crm-writer", daemon=True)
+        self.writer_thread.start()
     
     def setup_database(self):
         """Initialize database with migrations"""
         try:
-            self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            self.conn = sqlite3.connect(self.db_file, check_same_thread=False,
+                                        cached_statements=self.CACHED_STATEMENTS)
             self.conn.row_factory = sqlite3.Row
             self.cursor = self.conn.cursor()
             
             # Enable foreign keys and WAL mode for better performance
-            self.cursor.execute("PRAGMA foreign_keys = ON")
-            self.cursor.execute("PRAGMA journal_mode = WAL")
+            self.apply_pragmas(self.conn)
             
             # Check current version
             self.cursor.execute('''
@@ -615,6 +866,17 @@ class UltimateCRM:
             if current_version < self.migration_version:
                 self.run_migrations(current_version)
             
+            # Create indexes for performance (IF NOT EXISTS, so existing databases pick up new ones)
+            self.create_indexes()
+            self.setup_search_index()
+            
+            self.cursor.execute("PRAGMA table_info(leads)")
+            self.lead_columns = frozenset(row[1] for row in self.cursor.fetchall())
+            
+            # Known fingerprints, so duplicate scrapes are rejected without a query
+            self.cursor.execute("SELECT fingerprint, id FROM leads WHERE fingerprint IS NOT NULL")
+            self.fingerprints = {row[0]: row[1] for row in self.cursor.fetchall()}
+            
             # Create audit log table
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS audit_log (
@@ -871,25 +1133,28 @@ class UltimateCRM:
             
             self.conn.commit()
             
-            # Create indexes for performance
-            self.create_indexes()
-            
         except Exception as e:
             self.conn.rollback()
             logger.log(f"❌ Migration error: {e}", "ERROR")
             raise
     
     def create_indexes(self):
-        """Create performance indexes"""
+        """Create performance indexes and refresh planner statistics"""
+        # Superseded by the partial indexes below (fingerprint is already covered by its UNIQUE index)
+        retired_indexes = [
+            "idx_leads_fingerprint", "idx_leads_status", "idx_leads_quality", "idx_leads_city",
+            "idx_leads_industry", "idx_leads_created", "idx_leads_website_status",
+        ]
+        
+        # Every dashboard read filters on is_archived = 0, so lead indexes only cover active rows
         indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_leads_fingerprint ON leads(fingerprint)",
-            "CREATE INDEX IF NOT EXISTS idx_leads_status ON leads(lead_status)",
-            "CREATE INDEX IF NOT EXISTS idx_leads_quality ON leads(quality_tier)",
-            "CREATE INDEX IF NOT EXISTS idx_leads_city ON leads(city)",
-            "CREATE INDEX IF NOT EXISTS idx_leads_industry ON leads(industry)",
+            "CREATE INDEX IF NOT EXISTS idx_leads_status_active ON leads(lead_status) WHERE is_archived = 0",
+            "CREATE INDEX IF NOT EXISTS idx_leads_quality_active ON leads(quality_tier) WHERE is_archived = 0",
+            "CREATE INDEX IF NOT EXISTS idx_leads_website_status_active ON leads(website_status) WHERE is_archived = 0",
+            "CREATE INDEX IF NOT EXISTS idx_leads_city_active ON leads(city) WHERE is_archived = 0",
+            "CREATE INDEX IF NOT EXISTS idx_leads_industry_active ON leads(industry) WHERE is_archived = 0",
+            "CREATE INDEX IF NOT EXISTS idx_leads_active_created ON leads(created_at DESC) WHERE is_archived = 0",
             "CREATE INDEX IF NOT EXISTS idx_leads_score ON leads(lead_score)",
-            "CREATE INDEX IF NOT EXISTS idx_leads_created ON leads(created_at)",
-            "CREATE INDEX IF NOT EXISTS idx_leads_website_status ON leads(website_status)",
             
             "CREATE INDEX IF NOT EXISTS idx_activities_lead ON activities(lead_id)",
             "CREATE INDEX IF NOT EXISTS idx_activities_created ON activities(created_at)",
@@ -898,6 +1163,9 @@ class UltimateCRM:
             "CREATE INDEX IF NOT EXISTS idx_campaign_leads_next_action ON campaign_leads(next_action_date)",
         ]
         
+        for index_name in retired_indexes:
+            self.cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+        
         for index_sql in indexes:
             try:
                 self.cursor.execute(index_sql)
@@ -905,160 +1173,465 @@ class UltimateCRM:
                 logger.log(f"Index creation error: {e}", "WARNING")
         
         self.conn.commit()
+        
+        # Full ANALYZE once so the planner knows index cardinalities, then let SQLite decide
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if self.cursor.fetchone():
+            self.cursor.execute("PRAGMA optimize")
+        else:
+            self.cursor.execute("ANALYZE")
+        self.conn.commit()
+    
+    def setup_search_index(self):
+        """Create the FTS5 trigram index behind the leads search filter, falling back to LIKE without it"""
+        columns = ', '.join(self.SEARCH_COLUMNS)
+        new_values = ', '.join(f"new.{column}" for column in self.SEARCH_COLUMNS)
+        old_values = ', '.join(f"old.{column}" for column in self.SEARCH_COLUMNS)
+        
+        try:
+            self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'leads_fts'")
+            exists = self.cursor.fetchone() is not None
+            
+            self.cursor.executescript(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS leads_fts USING fts5(
+                    {columns}, content='leads', content_rowid='id', tokenize='trigram'
+                );
+                
+                CREATE TRIGGER IF NOT EXISTS leads_fts_insert AFTER INSERT ON leads BEGIN
+                    INSERT INTO leads_fts (rowid, {columns}) VALUES (new.id, {new_values});
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS leads_fts_delete AFTER DELETE ON leads BEGIN
+                    INSERT INTO leads_fts (leads_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS leads_fts_update AFTER UPDATE OF {columns} ON leads BEGIN
+                    INSERT INTO leads_fts (leads_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                    INSERT INTO leads_fts (rowid, {columns}) VALUES (new.id, {new_values});
+                END;
+            ''')
+            
+            # Index the leads stored before the table existed
+            if not exists:
+                self.cursor.execute("INSERT INTO leads_fts (leads_fts) VALUES ('rebuild')")
+            self.conn.commit()
+            self.search_fts = True
+            
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.log(f"Full-text search unavailable, using LIKE search: {e}", "WARNING")
     
     def get_connection(self):
-        """Get a new database connection"""
-        conn = sqlite3.connect(self.db_file, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get a pooled read-write database connection; return it with release_connection"""
+        try:
+            return self.pool.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(self.db_file, check_same_thread=False,
+                                   cached_statements=self.CACHED_STATEMENTS)
+            conn.row_factory = sqlite3.Row
+            self.apply_pragmas(conn)
+            return conn
+    
+    def get_read_connection(self) -> ReadOnlyConnection:
+        """Get a pooled read-only connection for SELECT-only methods; return it with release_connection"""
+        try:
+            return self.read_pool.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(f"{Path(self.db_file).absolute().as_uri()}?mode=ro", uri=True,
+                                   check_same_thread=False, factory=ReadOnlyConnection,
+                                   cached_statements=self.CACHED_STATEMENTS)
+            conn.row_factory = sqlite3.Row
+            self.apply_pragmas(conn)
+            return conn
+    
+    def release_connection(self, conn: sqlite3.Connection):
+        """Return a connection to its pool, discarding any uncommitted work"""
+        pool = self.read_pool if isinstance(conn, ReadOnlyConnection) else self.pool
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            pool.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+    
+    def run_maintenance(self):
+        """Background loop: refresh daily statistics, then periodically optimize and checkpoint the WAL"""
+        last_optimize = last_checkpoint = time.time()
+        
+        while not self.stop_event.wait(self.STATISTICS_REFRESH_SECONDS):
+            now = time.time()
+            conn = self.get_connection()
+            
+            try:
+                if self.stats_dirty.is_set():
+                    self.stats_dirty.clear()
+                    self.update_daily_statistics(conn.cursor())
+                    conn.commit()
+                
+                if now - last_optimize >= self.OPTIMIZE_INTERVAL_SECONDS:
+                    conn.execute("PRAGMA optimize")
+                    last_optimize = now
+                
+                if now - last_checkpoint >= self.CHECKPOINT_INTERVAL_SECONDS:
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                    last_checkpoint = now
+                    
+            except Exception as e:
+                logger.log(f"CRM maintenance error: {e}", "WARNING")
+            finally:
+                self.release_connection(conn)
+    
+    def queue_leads(self, leads: List[Dict], user_id: Optional[int] = None) -> concurrent.futures.Future:
+        """Queue leads for the writer thread; the future resolves to save_leads_bulk's per-lead results"""
+        future = concurrent.futures.Future()
+        if not self.writer_thread.is_alive():
+            # No writer to hand off to (stopped or crashed); save on the caller's thread instead
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(self.save_leads_bulk(leads, user_id))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        
+        self.write_queue.put((leads, user_id, future))
+        return future
+    
+    def run_writer(self):
+        """Writer thread: merge batches queued within WRITER_LINGER_SECONDS into one bulk save"""
+        while True:
+            item = self.write_queue.get()
+            if item is None:
+                return
+            
+            batch = [item]
+            queued = len(item[0])
+            deadline = time.monotonic() + self.WRITER_LINGER_SECONDS
+            stopping = False
+            
+            while queued < self.LEAD_BATCH_SIZE:
+                try:
+                    item = self.write_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                queued += len(item[0])
+            
+            try:
+                self.write_queued_leads(batch)
+            except Exception as e:
+                # Keep the writer alive: fail this batch's callers and carry on with the next one
+                logger.log(f"CRM writer error: {e}", "ERROR")
+                for _, _, future in batch:
+                    if not future.done():
+                        try:
+                            future.set_exception(e)
+                        except concurrent.futures.InvalidStateError:
+                            pass
+            if stopping:
+                return
+    
+    def write_queued_leads(self, batch: List[Tuple[List[Dict], Optional[int], concurrent.futures.Future]]):
+        """Save merged queued batches (one save per audit user) and hand each caller its slice of results"""
+        by_user = {}
+        for leads, user_id, future in batch:
+            # Cancelled callers (e.g. a cycle torn down mid-await) get no result, but their leads are still saved
+            active = future.set_running_or_notify_cancel()
+            by_user.setdefault(user_id, []).append((leads, future if active else None))
+        
+        for user_id, items in by_user.items():
+            try:
+                results = self.save_leads_bulk([lead for leads, _ in items for lead in leads], user_id)
+            except Exception as e:
+                for _, future in items:
+                    if future is not None:
+                        future.set_exception(e)
+                continue
+            
+            offset = 0
+            for leads, future in items:
+                if future is not None:
+                    future.set_result(results[offset:offset + len(leads)])
+                offset += len(leads)
+    
+    def close(self):
+        """Flush queued leads, stop background threads, flush pending statistics and close every connection"""
+        if self.writer_thread.is_alive():
+            self.write_queue.put(None)
+            self.writer_thread.join(timeout=30)
+        
+        self.stop_event.set()
+        # Let an in-flight maintenance pass return its connection before the pools are drained
+        if self.maintenance_thread.is_alive():
+            self.maintenance_thread.join(timeout=30)
+        
+        if self.stats_dirty.is_set():
+            self.stats_dirty.clear()
+            conn = self.get_connection()
+            try:
+                self.update_daily_statistics(conn.cursor())
+                conn.commit()
+            finally:
+                self.release_connection(conn)
+        
+        for pool in (self.pool, self.read_pool):
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+        self.http.close()
+    
+    @classmethod
+    def create_http_session(cls) -> requests.Session:
+        """Create the keep-alive session used for website status checks, with pooled connections and connect retries"""
+        session = requests.Session()
+        session.headers.update(cls.HTTP_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=50, pool_maxsize=100,
+            max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.2,
+                              allowed_methods=frozenset({'HEAD', 'GET'}))
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def apply_pragmas(self, conn: sqlite3.Connection):
+        """Apply the WAL and per-connection tuning pragmas shared by every connection"""
+        # journal_mode is persistent in the database file; the rest are per-connection
+        if not isinstance(conn, ReadOnlyConnection):
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MB page cache
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB memory-mapped reads
+        conn.execute("PRAGMA busy_timeout = 30000")  # Wait up to 30s on a locked database
+        conn.execute("PRAGMA foreign_keys = ON")
+    
+    def lead_exists(self, fingerprint: str) -> bool:
+        """Check whether a lead with this fingerprint is already stored"""
+        with self.fingerprint_lock:
+            return fingerprint in self.fingerprints
     
     def save_lead(self, lead_data: Dict, user_id: Optional[int] = None) -> Dict:
         """Save lead to database with audit logging"""
+        return self.save_leads_bulk([lead_data], user_id)[0]
+    
+    @staticmethod
+    def _prepare_row(lead_data: Dict) -> Tuple[Tuple[str, ...], Tuple]:
+        """Fingerprint a lead and return its (columns, values) for insertion"""
+        # Generate fingerprint if not provided
+        if not lead_data.get("fingerprint"):
+            fingerprint_data = (
+                lead_data.get("business_name", ""),
+                lead_data.get("website", ""),
+                lead_data.get("phone", ""),
+                lead_data.get("city", "")
+            )
+            lead_data["fingerprint"] = hashlib.sha256(str(fingerprint_data).encode()).hexdigest()
+        
+        # Satisfy the table's NOT NULL and CHECK constraints (AI-enriched scores are not clamped upstream)
+        if not lead_data.get("business_name"):
+            lead_data["business_name"] = "Unknown Business"
+        if lead_data.get("lead_score") is not None:
+            try:
+                lead_data["lead_score"] = max(0, min(100, int(float(lead_data["lead_score"]))))
+            except (TypeError, ValueError):
+                lead_data["lead_score"] = 0
+        
+        columns = []
+        values = []
+        for column in UltimateCRM.LEAD_INSERT_COLUMNS:
+            value = lead_data.get(column)
+            if value is None:
+                continue
+            
+            # Convert lists/dicts to JSON strings
+            if isinstance(value, (list, dict)):
+                value = json_dumps(value)
+            
+            columns.append(column)
+            values.append(value)
+        
+        return tuple(columns), tuple(values)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def insert_lead_sql(columns: Tuple[str, ...], set_production_date: bool) -> str:
+        """Build (once per column set) the INSERT statement for leads carrying these columns"""
+        # Timestamps the caller did not supply are filled in by SQLite
+        defaults = {"created_at": "CURRENT_TIMESTAMP", "updated_at": "CURRENT_TIMESTAMP"}
+        if "scraped_date" not in columns:
+            defaults["scraped_date"] = "CURRENT_TIMESTAMP"
+        if set_production_date:
+            defaults["lead_production_date"] = "DATE('now')"
+        
+        return f'''
+            INSERT INTO leads ({', '.join(columns + tuple(defaults))})
+            VALUES ({', '.join(['?'] * len(columns) + list(defaults.values()))})
+            ON CONFLICT(fingerprint) DO NOTHING
+        '''
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def update_lead_sql(fields: Tuple[str, ...]) -> str:
+        """Build (once per field set) the UPDATE statement for these whitelisted lead fields"""
+        set_clause = ", ".join(f"{field} = ?" for field in fields)
+        return f"UPDATE leads SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+    
+    @staticmethod
+    def fingerprint_ids(cursor: sqlite3.Cursor, fingerprints: List[str]) -> Dict[str, int]:
+        """Map the given fingerprints to the ids of leads that already exist"""
+        if not fingerprints:
+            return {}
+        placeholders = ','.join(['?'] * len(fingerprints))
+        cursor.execute(f"SELECT fingerprint, id FROM leads WHERE fingerprint IN ({placeholders})", fingerprints)
+        return {row[0]: row[1] for row in cursor.fetchall()}
+    
+    def save_leads_bulk(self, leads: List[Dict], user_id: Optional[int] = None) -> List[Dict]:
+        """Save leads in one transaction per batch; returns one result per lead, in order"""
+        results = []
+        if not leads:
+            return results
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            # Generate fingerprint if not provided
-            fingerprint = lead_data.get("fingerprint")
-            if not fingerprint:
-                fingerprint_data = (
-                    lead_data.get("business_name", ""),
-                    lead_data.get("website", ""),
-                    lead_data.get("phone", ""),
-                    lead_data.get("city", "")
-                )
-                fingerprint = hashlib.sha256(str(fingerprint_data).encode()).hexdigest()
-            
-            lead_data["fingerprint"] = fingerprint
-            
-            # Check for duplicates
-            if CONFIG.crm.prevent_duplicates:
-                cursor.execute("SELECT id FROM leads WHERE fingerprint = ?", (fingerprint,))
-                existing = cursor.fetchone()
-                if existing:
-                    return {
-                        "success": False,
-                        "message": "Duplicate lead detected",
-                        "lead_id": existing[0],
-                        "action": "skipped"
-                    }
-            
-            # Website status analysis
-            website_status = lead_data.get("website_status", "unknown")
-            if not website_status or website_status == "unknown":
-                website = lead_data.get("website", "")
-                if website:
-                    website_status = self.analyze_website_status(website, lead_data)
-                    lead_data["website_status"] = website_status
-            
-            # Prepare data for insertion
-            columns = []
-            placeholders = []
-            values = []
-            
-            # Map lead data to table columns
-            column_mapping = {
-                'fingerprint': 'fingerprint',
-                'business_name': 'business_name',
-                'website': 'website',
-                'website_status': 'website_status',
-                'phone': 'phone',
-                'email': 'email',
-                'address': 'address',
-                'city': 'city',
-                'state': 'state',
-                'zip_code': 'zip_code',
-                'country': 'country',
-                'industry': 'industry',
-                'business_type': 'business_type',
-                'services': 'services',
-                'description': 'description',
-                'social_media': 'social_media',
-                'lead_score': 'lead_score',
-                'quality_tier': 'quality_tier',
-                'potential_value': 'potential_value',
-                'estimated_revenue': 'estimated_revenue',
-                'employee_count': 'employee_count',
-                'years_in_business': 'years_in_business',
-                'decision_maker_name': 'decision_maker_name',
-                'decision_maker_title': 'decision_maker_title',
-                'decision_maker_email': 'decision_maker_email',
-                'decision_maker_phone': 'decision_maker_phone',
-                'outreach_priority': 'outreach_priority',
-                'lead_status': 'lead_status',
-                'assigned_to': 'assigned_to',
-                'lead_source': 'lead_source',
-                'scraped_date': 'scraped_date',
-                'google_business_url': 'google_business_url',
-                'facebook_business_url': 'facebook_business_url',
-                'yelp_business_url': 'yelp_business_url',
-                'bbb_business_url': 'bbb_business_url',
-                'other_platforms': 'other_platforms',
-                'notes': 'notes',
-                'ai_notes': 'ai_notes',
-                'outreach_strategy': 'outreach_strategy'
+            for start in range(0, len(leads), self.LEAD_BATCH_SIZE):
+                batch = leads[start:start + self.LEAD_BATCH_SIZE]
+                try:
+                    batch_results = self._save_leads_batch(cursor, batch, user_id)
+                    conn.commit()
+                except sqlite3.IntegrityError as e:
+                    # One bad row must not sink the rest of the batch: retry lead by lead
+                    conn.rollback()
+                    logger.log(f"Batch insert rejected ({e}); retrying leads individually", "WARNING")
+                    batch_results = []
+                    for lead_data in batch:
+                        try:
+                            batch_results.extend(self._save_leads_batch(cursor, [lead_data], user_id))
+                            conn.commit()
+                        except sqlite3.IntegrityError as row_error:
+                            conn.rollback()
+                            batch_results.append({
+                                "success": False,
+                                "message": f"Error: {str(row_error)}",
+                                "action": "error"
+                            })
+                results.extend(batch_results)
+                
+                # Remember committed fingerprints for the next duplicate check
+                with self.fingerprint_lock:
+                    for lead_data, result in zip(batch, batch_results):
+                        if result.get("lead_id"):
+                            self.fingerprints[lead_data["fingerprint"]] = result["lead_id"]
+        except Exception as e:
+            conn.rollback()
+            logger.log(f"Save lead error: {e}", "ERROR")
+            results.extend(
+                {"success": False, "message": f"Error: {str(e)}"}
+                for _ in range(len(leads) - len(results))
+            )
+        finally:
+            self.release_connection(conn)
+        
+        return results
+    
+    def _save_leads_batch(self, cursor: sqlite3.Cursor, leads: List[Dict],
+                          user_id: Optional[int]) -> List[Dict]:
+        """Insert one batch of leads inside a single write transaction"""
+        rows = [self._prepare_row(lead_data) for lead_data in leads]
+        
+        # Duplicates already seen by this process never reach SQLite
+        with self.fingerprint_lock:
+            known = {
+                lead_data["fingerprint"]: self.fingerprints[lead_data["fingerprint"]]
+                for lead_data in leads if lead_data["fingerprint"] in self.fingerprints
             }
-            
-            for data_key, column_name in column_mapping.items():
-                if data_key in lead_data and lead_data[data_key] is not None:
-                    value = lead_data[data_key]
-                    
-                    # Convert lists/dicts to JSON strings
-                    if isinstance(value, (list, dict)):
-                        value = json.dumps(value)
-                    
-                    columns.append(column_name)
-                    placeholders.append('?')
-                    values.append(value)
-            
-            # Add system fields
-            columns.extend(['created_at', 'updated_at'])
-            placeholders.extend(['CURRENT_TIMESTAMP', 'CURRENT_TIMESTAMP'])
-            
-            # Build and execute insert query
-            query = f'''
-                INSERT INTO leads ({', '.join(columns)})
-                VALUES ({', '.join(placeholders)})
-            '''
-            
-            cursor.execute(query, values)
-            lead_id = cursor.lastrowid
-            
-            # Log activity
-            cursor.execute('''
+        fingerprints = list({lead_data["fingerprint"] for lead_data in leads} - known.keys())
+        
+        # Website status analysis (network) for new leads only, before taking the write lock
+        for index, lead_data in enumerate(leads):
+            if lead_data["fingerprint"] in known:
+                continue
+            website_status = lead_data.get("website_status", "unknown")
+            website = lead_data.get("website", "")
+            if (not website_status or website_status == "unknown") and website:
+                lead_data["website_status"] = self.analyze_website_status(website, lead_data)
+                rows[index] = self._prepare_row(lead_data)
+        
+        cursor.execute("BEGIN IMMEDIATE")
+        
+        # Check the rest against the table, which other processes may also write to
+        existing = {**known, **self.fingerprint_ids(cursor, fingerprints)}
+        
+        # Group rows by column set so each shape is a single executemany
+        pending = {}
+        new_leads = {}
+        for lead_data, (columns, values) in zip(leads, rows):
+            fingerprint = lead_data["fingerprint"]
+            if fingerprint in existing or fingerprint in new_leads:
+                continue
+            new_leads[fingerprint] = lead_data
+            pending.setdefault(columns, []).append(values)
+        
+        for columns, values in pending.items():
+            cursor.executemany(self.insert_lead_sql(columns, CONFIG.crm.auto_set_production_date), values)
+        
+        created = self.fingerprint_ids(cursor, list(new_leads))
+        
+        if created:
+            # Log activities in one statement, straight from the inserted rows
+            lead_ids = list(created.values())
+            cursor.execute(f'''
                 INSERT INTO activities (lead_id, activity_type, activity_details)
-                VALUES (?, ?, ?)
-            ''', (lead_id, "Lead Created", f"Lead scraped from {lead_data.get('website', 'unknown')}"))
+                SELECT id, 'Lead Created', 'Lead scraped from ' || COALESCE(website, 'unknown')
+                FROM leads WHERE id IN ({','.join(['?'] * len(lead_ids))})
+            ''', lead_ids)
             
-            # Update daily statistics
-            self.update_daily_statistics(cursor)
+            # Daily statistics are refreshed by the maintenance thread
+            self.stats_dirty.set()
             
             # Audit log
             if user_id:
-                self.log_audit(
-                    user_id=user_id,
-                    action="CREATE_LEAD",
-                    entity_type="lead",
-                    entity_id=lead_id,
-                    new_values=json.dumps(lead_data)
-                )
-            
-            conn.commit()
-            
-            return {
-                "success": True,
-                "lead_id": lead_id,
-                "message": "Lead saved successfully",
-                "fingerprint": fingerprint,
-                "website_status": website_status
-            }
-            
-        except Exception as e:
-            conn.rollback()
-            logger.log(f"Save lead error: {e}", "ERROR")
-            return {"success": False, "message": f"Error: {str(e)}"}
-        finally:
-            conn.close()
+                for fingerprint, lead_id in created.items():
+                    self.log_audit(
+                        cursor=cursor,
+                        user_id=user_id,
+                        action="CREATE_LEAD",
+                        entity_type="lead",
+                        entity_id=lead_id,
+                        new_values=json.dumps(new_leads[fingerprint])
+                    )
+        
+        results = []
+        reported = set()
+        for lead_data in leads:
+            fingerprint = lead_data["fingerprint"]
+            if fingerprint in created and fingerprint not in reported:
+                reported.add(fingerprint)
+                results.append({
+                    "success": True,
+                    "lead_id": created[fingerprint],
+                    "message": "Lead saved successfully",
+                    "fingerprint": fingerprint,
+                    "website_status": lead_data.get("website_status", "unknown")
+                })
+            else:
+                results.append({
+                    "success": False,
+                    "message": "Duplicate lead detected",
+                    "lead_id": existing.get(fingerprint, created.get(fingerprint)),
+                    "action": "skipped"
+                })
+        
+        return results
     
     def analyze_website_status(self, website: str, lead_data: Dict) -> str:
         """Analyze website status"""
@@ -1066,18 +1639,14 @@ class UltimateCRM:
             return "no_website"
         
         try:
-            # Check if website is accessible
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.head(website, headers=headers, timeout=10, allow_redirects=True)
+            # Check if website is accessible (HEAD and GET share one pooled keep-alive connection)
+            response = self.http.head(website, timeout=10, allow_redirects=True)
             
             if response.status_code >= 400:
                 return "broken"
             
             # Check for parked domains or placeholders
-            response = requests.get(website, headers=headers, timeout=10)
+            response = self.http.get(website, timeout=10)
             content = response.text.lower()
             
             parked_indicators = [
@@ -1107,41 +1676,23 @@ class UltimateCRM:
     def update_daily_statistics(self, cursor):
         """Update daily statistics"""
         try:
-            today = datetime.now().date().isoformat()
-            
-            # Get counts for today
-            cursor.execute('''
-                SELECT 
-                    COUNT(*) as total_leads,
-                    SUM(CASE WHEN lead_status = 'New Lead' THEN 1 ELSE 0 END) as new_leads,
-                    SUM(CASE WHEN lead_status = 'Contacted' THEN 1 ELSE 0 END) as contacted_leads,
-                    SUM(CASE WHEN lead_status IN ('Meeting Scheduled', 'Zoom Meeting') THEN 1 ELSE 0 END) as meetings_scheduled,
-                    SUM(CASE WHEN lead_status = 'Closed (Won)' THEN 1 ELSE 0 END) as closed_won,
-                    SUM(CASE WHEN lead_status = 'Closed (Lost)' THEN 1 ELSE 0 END) as closed_lost,
-                    SUM(CASE WHEN quality_tier IN ('Premium', 'High') THEN 1 ELSE 0 END) as premium_leads,
-                    SUM(potential_value) as estimated_value
-                FROM leads 
-                WHERE DATE(created_at) = DATE('now') AND is_archived = 0
-            ''')
-            
+            # Get counts for today (UTC, the same clock CURRENT_TIMESTAMP stamps created_at with)
+            cursor.execute(self.DAILY_STATISTICS_SELECT_SQL)
             stats = cursor.fetchone()
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO daily_statistics 
-                (stat_date, total_leads, new_leads, contacted_leads, meetings_scheduled, 
-                 closed_won, closed_lost, premium_leads, estimated_value)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (today, *stats))
+            cursor.execute(self.DAILY_STATISTICS_UPSERT_SQL, tuple(stats))
             
         except Exception as e:
             logger.log(f"Statistics update error: {e}", "WARNING")
     
     def log_audit(self, user_id: Optional[int], action: str, entity_type: str = None,
                  entity_id: int = None, old_values: str = None, new_values: str = None,
-                 ip_address: str = None, user_agent: str = None):
-        """Log audit trail"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+                 ip_address: str = None, user_agent: str = None, cursor: sqlite3.Cursor = None):
+        """Log audit trail; pass the caller's cursor to record it inside that transaction"""
+        conn = None
+        if cursor is None:
+            conn = self.get_connection()
+            cursor = conn.cursor()
         
         try:
             cursor.execute('''
@@ -1150,163 +1701,199 @@ class UltimateCRM:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             ''', (user_id, action, entity_type, entity_id, old_values, new_values, ip_address, user_agent))
             
-            conn.commit()
+            if conn:
+                conn.commit()
         except Exception as e:
             logger.log(f"Audit log error: {e}", "WARNING")
         finally:
-            conn.close()
+            if conn:
+                self.release_connection(conn)
+    
+    def build_filter_conditions(self, filters: Optional[Dict]) -> Tuple[List[str], List]:
+        """Build WHERE conditions and parameters for a leads filter dict (leads aliased as l)"""
+        params = []
+        conditions = []
+        
+        # Apply filters
+        if filters:
+            # Text search
+            if filters.get("search") and self.search_fts and len(filters["search"]) >= 3:
+                # Trigram MATCH on a quoted phrase is a case-insensitive substring match, like LIKE '%term%'
+                conditions.append("l.id IN (SELECT rowid FROM leads_fts WHERE leads_fts MATCH ?)")
+                params.append('"' + filters["search"].replace('"', '""') + '"')
+            elif filters.get("search"):
+                # Terms shorter than a trigram
+                search_term = f"%{filters['search']}%"
+                conditions.append('''
+                    (l.business_name LIKE ? OR 
+                     l.website LIKE ? OR 
+                     l.phone LIKE ? OR 
+                     l.email LIKE ? OR 
+                     l.city LIKE ? OR 
+                     l.industry LIKE ?)
+                ''')
+                params.extend([search_term] * 6)
+            
+            # Status filter
+            if filters.get("status"):
+                if isinstance(filters["status"], list):
+                    placeholders = ','.join(['?'] * len(filters["status"]))
+                    conditions.append(f"l.lead_status IN ({placeholders})")
+                    params.extend(filters["status"])
+                else:
+                    conditions.append("l.lead_status = ?")
+                    params.append(filters["status"])
+            
+            # Quality tier filter
+            if filters.get("quality_tier"):
+                if isinstance(filters["quality_tier"], list):
+                    placeholders = ','.join(['?'] * len(filters["quality_tier"]))
+                    conditions.append(f"l.quality_tier IN ({placeholders})")
+                    params.extend(filters["quality_tier"])
+                else:
+                    conditions.append("l.quality_tier = ?")
+                    params.append(filters["quality_tier"])
+            
+            # Website status filter
+            if filters.get("website_status"):
+                if isinstance(filters["website_status"], list):
+                    placeholders = ','.join(['?'] * len(filters["website_status"]))
+                    conditions.append(f"l.website_status IN ({placeholders})")
+                    params.extend(filters["website_status"])
+                else:
+                    conditions.append("l.website_status = ?")
+                    params.append(filters["website_status"])
+            
+            # City filter
+            if filters.get("city"):
+                if isinstance(filters["city"], list):
+                    placeholders = ','.join(['?'] * len(filters["city"]))
+                    conditions.append(f"l.city IN ({placeholders})")
+                    params.extend(filters["city"])
+                else:
+                    conditions.append("l.city = ?")
+                    params.append(filters["city"])
+            
+            # Industry filter
+            if filters.get("industry"):
+                if isinstance(filters["industry"], list):
+                    placeholders = ','.join(['?'] * len(filters["industry"]))
+                    conditions.append(f"l.industry IN ({placeholders})")
+                    params.extend(filters["industry"])
+                else:
+                    conditions.append("l.industry = ?")
+                    params.append(filters["industry"])
+            
+            # Score range
+            if filters.get("min_score"):
+                conditions.append("l.lead_score >= ?")
+                params.append(filters["min_score"])
+            
+            if filters.get("max_score"):
+                conditions.append("l.lead_score <= ?")
+                params.append(filters["max_score"])
+            
+            # Date range
+            if filters.get("date_from"):
+                conditions.append("l.created_at >= DATE(?)")
+                params.append(filters["date_from"])
+            
+            if filters.get("date_to"):
+                conditions.append("l.created_at < DATE(?, '+1 day')")
+                params.append(filters["date_to"])
+            
+            # Assigned to
+            if filters.get("assigned_to"):
+                conditions.append("l.assigned_to = ?")
+                params.append(filters["assigned_to"])
+        
+        return conditions, params
+    
+    @classmethod
+    def parse_json_fields(cls, lead_dict: Dict) -> Dict:
+        """Decode the JSON-encoded list/dict columns of a lead row in place"""
+        for field in cls.JSON_FIELDS:
+            value = lead_dict.get(field)
+            if value and isinstance(value, str):
+                try:
+                    lead_dict[field] = json_loads(value)
+                except ValueError:
+                    pass  # Legacy plain-text value
+        return lead_dict
     
     def get_leads(self, filters: Dict = None, page: int = 1, per_page: int = 50,
-                 sort_by: str = "created_at", sort_order: str = "DESC") -> Dict:
-        """Get leads with advanced filtering and pagination"""
-        conn = self.get_connection()
+                 sort_by: str = "created_at", sort_order: str = "DESC",
+                 columns: Optional[Tuple[str, ...]] = None) -> Dict:
+        """Get leads with advanced filtering and pagination; list views pass the columns they
+        display (plus activity_count / last_activity_date if shown) instead of fetching every field"""
+        conn = self.get_read_connection()
         cursor = conn.cursor()
         
         try:
-            # Base query
-            query = '''
-                SELECT 
-                    l.*,
-                    COUNT(a.id) as activity_count,
-                    MAX(a.created_at) as last_activity_date
-                FROM leads l
-                LEFT JOIN activities a ON l.id = a.lead_id
-                WHERE l.is_archived = 0
-            '''
-            
-            params = []
-            conditions = []
-            
-            # Apply filters
-            if filters:
-                # Text search
-                if filters.get("search"):
-                    search_term = f"%{filters['search']}%"
-                    conditions.append('''
-                        (l.business_name LIKE ? OR 
-                         l.website LIKE ? OR 
-                         l.phone LIKE ? OR 
-                         l.email LIKE ? OR 
-                         l.city LIKE ? OR 
-                         l.industry LIKE ?)
-                    ''')
-                    params.extend([search_term] * 6)
-                
-                # Status filter
-                if filters.get("status"):
-                    if isinstance(filters["status"], list):
-                        placeholders = ','.join(['?'] * len(filters["status"]))
-                        conditions.append(f"l.lead_status IN ({placeholders})")
-                        params.extend(filters["status"])
-                    else:
-                        conditions.append("l.lead_status = ?")
-                        params.append(filters["status"])
-                
-                # Quality tier filter
-                if filters.get("quality_tier"):
-                    if isinstance(filters["quality_tier"], list):
-                        placeholders = ','.join(['?'] * len(filters["quality_tier"]))
-                        conditions.append(f"l.quality_tier IN ({placeholders})")
-                        params.extend(filters["quality_tier"])
-                    else:
-                        conditions.append("l.quality_tier = ?")
-                        params.append(filters["quality_tier"])
-                
-                # Website status filter
-                if filters.get("website_status"):
-                    if isinstance(filters["website_status"], list):
-                        placeholders = ','.join(['?'] * len(filters["website_status"]))
-                        conditions.append(f"l.website_status IN ({placeholders})")
-                        params.extend(filters["website_status"])
-                    else:
-                        conditions.append("l.website_status = ?")
-                        params.append(filters["website_status"])
-                
-                # City filter
-                if filters.get("city"):
-                    if isinstance(filters["city"], list):
-                        placeholders = ','.join(['?'] * len(filters["city"]))
-                        conditions.append(f"l.city IN ({placeholders})")
-                        params.extend(filters["city"])
-                    else:
-                        conditions.append("l.city = ?")
-                        params.append(filters["city"])
-                
-                # Industry filter
-                if filters.get("industry"):
-                    if isinstance(filters["industry"], list):
-                        placeholders = ','.join(['?'] * len(filters["industry"]))
-                        conditions.append(f"l.industry IN ({placeholders})")
-                        params.extend(filters["industry"])
-                    else:
-                        conditions.append("l.industry = ?")
-                        params.append(filters["industry"])
-                
-                # Score range
-                if filters.get("min_score"):
-                    conditions.append("l.lead_score >= ?")
-                    params.append(filters["min_score"])
-                
-                if filters.get("max_score"):
-                    conditions.append("l.lead_score <= ?")
-                    params.append(filters["max_score"])
-                
-                # Date range
-                if filters.get("date_from"):
-                    conditions.append("DATE(l.created_at) >= ?")
-                    params.append(filters["date_from"])
-                
-                if filters.get("date_to"):
-                    conditions.append("DATE(l.created_at) <= ?")
-                    params.append(filters["date_to"])
+            if columns is None:
+                lead_select = "l.*"
+                activity_stats = self.ACTIVITY_STAT_COLUMNS
+            else:
+                activity_stats = tuple(column for column in self.ACTIVITY_STAT_COLUMNS if column in columns)
+                lead_columns = [column for column in columns if column not in activity_stats]
+                unknown = set(lead_columns) - self.lead_columns
+                if unknown:
+                    raise ValueError(f"Unknown lead columns: {', '.join(sorted(unknown))}")
                 
-                # Assigned to
-                if filters.get("assigned_to"):
-                    conditions.append("l.assigned_to = ?")
-                    params.append(filters["assigned_to"])
+                # id and the sort column are needed by the outer query
+                lead_columns = dict.fromkeys(["id", *lead_columns, sort_by if sort_by in self.lead_columns else "id"])
+                lead_select = ", ".join(f"l.{column}" for column in lead_columns)
             
-            # Add conditions to query
-            if conditions:
-                query += " AND " + " AND ".join(conditions)
+            # Filtered page; the window count carries the total on every row
+            where = "WHERE l.is_archived = 0"
             
-            # Group by lead
-            query += " GROUP BY l.id"
+            conditions, params = self.build_filter_conditions(filters)
             
-            # Get total count
-            count_query = f"SELECT COUNT(*) as total FROM ({query})"
-            cursor.execute(count_query, params)
-            total_result = cursor.fetchone()
-            total = total_result['total'] if total_result else 0
+            # Add conditions to query
+            if conditions:
+                where += " AND " + " AND ".join(conditions)
             
             # Add sorting
+            page_order = outer_order = ""
             valid_sort_columns = ['created_at', 'updated_at', 'lead_score', 'potential_value', 
                                 'business_name', 'city', 'industry']
             if sort_by in valid_sort_columns:
-                query += f" ORDER BY l.{sort_by} {sort_order}"
+                page_order = f"ORDER BY l.{sort_by} {sort_order}"
+                outer_order = f"ORDER BY p.{sort_by} {sort_order}"
             
-            # Add pagination
-            query += " LIMIT ? OFFSET ?"
-            params.extend([per_page, (page - 1) * per_page])
-            
-            # Execute query
-            cursor.execute(query, params)
+            # Activity stats are computed for the page rows only
+            activity_select = "".join(f",\n{self.ACTIVITY_STAT_COLUMNS[column]}" for column in activity_stats)
+            query = f'''
+                SELECT 
+                    p.*{activity_select}
+                FROM (
+                    SELECT {lead_select}, COUNT(*) OVER () as _total
+                    FROM leads l
+                    {where}
+                    {page_order}
+                    LIMIT ? OFFSET ?
+                ) p
+                {outer_order}
+            '''
+            offset = (page - 1) * per_page
+            cursor.execute(query, params + [per_page, offset])
             leads = cursor.fetchall()
             
+            if leads:
+                total = leads[0]['_total']
+            elif offset:
+                # Past the last page: no row to carry the total
+                cursor.execute(f"SELECT COUNT(*) FROM leads l {where}", params)
+                total = cursor.fetchone()[0]
+            else:
+                total = 0
+            
             # Convert to list of dictionaries
             result = []
             for lead in leads:
                 lead_dict = dict(lead)
-                
-                # Parse JSON fields
-                json_fields = ['social_media', 'services', 'other_platforms']
-                for field in json_fields:
-                    if lead_dict.get(field) and isinstance(lead_dict[field], str):
-                        try:
-                            lead_dict[field] = json.loads(lead_dict[field])
-                        except:
-                            pass
-                
-                result.append(lead_dict)
+                del lead_dict['_total']
+                result.append(self.parse_json_fields(lead_dict))
             
             return {
                 "leads": result,
@@ -1320,11 +1907,11 @@ class UltimateCRM:
             logger.log(f"Get leads error: {e}", "ERROR")
             return {"leads": [], "total": 0, "page": page, "per_page": per_page}
         finally:
-            conn.close()
+            self.release_connection(conn)
     
     def get_lead_by_id(self, lead_id: int, include_activities: bool = True) -> Optional[Dict]:
         """Get lead by ID with optional activities"""
-        conn = self.get_connection()
+        conn = self.get_read_connection()
         cursor = conn.cursor()
         
         try:
@@ -1334,16 +1921,7 @@ class UltimateCRM:
             if not lead:
                 return None
             
-            lead_dict = dict(lead)
-            
-            # Parse JSON fields
-            json_fields = ['social_media', 'services', 'other_platforms']
-            for field in json_fields:
-                if lead_dict.get(field) and isinstance(lead_dict[field], str):
-                    try:
-                        lead_dict[field] = json.loads(lead_dict[field])
-                    except:
-                        pass
+            lead_dict = self.parse_json_fields(dict(lead))
             
             # Get activities if requested
             if include_activities:
@@ -1360,7 +1938,7 @@ class UltimateCRM:
             logger.log(f"Get lead error: {e}", "ERROR")
             return None
         finally:
-            conn.close()
+            self.release_connection(conn)
     
     def update_lead(self, lead_id: int, update_data: Dict, user_id: Optional[int] = None) -> Dict:
         """Update lead with audit logging"""
@@ -1377,32 +1955,28 @@ class UltimateCRM:
             
             old_values = dict(old_lead)
             
-            # Build update query
-            set_clause = []
-            params = []
+            # Build update query from whitelisted fields only; sorted so each field set is one statement
+            fields = tuple(sorted(update_data))
+            unknown = set(fields) - self.UPDATABLE_LEAD_COLUMNS
+            if unknown:
+                return {"success": False, "message": f"Cannot update fields: {', '.join(sorted(unknown))}"}
             
-            for field, value in update_data.items():
+            params = []
+            for field in fields:
+                value = update_data[field]
+                
                 # Convert lists/dicts to JSON strings
                 if isinstance(value, (list, dict)):
-                    value = json.dumps(value)
+                    value = json_dumps(value)
                 
-                set_clause.append(f"{field} = ?")
                 params.append(value)
             
-            # Add updated_at timestamp
-            set_clause.append("updated_at = CURRENT_TIMESTAMP")
-            
             params.append(lead_id)
-            query = f"UPDATE leads SET {', '.join(set_clause)} WHERE id = ?"
-            
-            cursor.execute(query, params)
+            cursor.execute(self.update_lead_sql(fields), params)
             
             # Log activity
             activity_desc = f"Updated fields: {', '.join(update_data.keys())}"
-            cursor.execute('''
-                INSERT INTO activities (lead_id, activity_type, activity_details)
-                VALUES (?, ?, ?)
-            ''', (lead_id, "Lead Updated", activity_desc))
+            cursor.execute(self.INSERT_ACTIVITY_SQL, (lead_id, "Lead Updated", activity_desc))
             
             # Audit log
             if user_id:
@@ -1410,6 +1984,7 @@ class UltimateCRM:
                 new_values.update(update_data)
                 
                 self.log_audit(
+                    cursor=cursor,
                     user_id=user_id,
                     action="UPDATE_LEAD",
                     entity_type="lead",
@@ -1427,7 +2002,7 @@ class UltimateCRM:
             logger.log(f"Update lead error: {e}", "ERROR")
             return {"success": False, "message": f"Error: {str(e)}"}
         finally:
-            conn.close()
+            self.release_connection(conn)
     
     def delete_lead(self, lead_id: int, user_id: Optional[int] = None, reason: str = None) -> Dict:
         """Soft delete lead (archive)"""
@@ -1452,14 +2027,12 @@ class UltimateCRM:
             ''', (reason or "Manual archive", lead_id))
             
             # Log activity
-            cursor.execute('''
-                INSERT INTO activities (lead_id, activity_type, activity_details)
-                VALUES (?, ?, ?)
-            ''', (lead_id, "Lead Archived", f"Archived: {reason or 'No reason provided'}"))
+            cursor.execute(self.INSERT_ACTIVITY_SQL, (lead_id, "Lead Archived", f"Archived: {reason or 'No reason provided'}"))
             
             # Audit log
             if user_id:
                 self.log_audit(
+                    cursor=cursor,
                     user_id=user_id,
                     action="ARCHIVE_LEAD",
                     entity_type="lead",
@@ -1476,11 +2049,11 @@ class UltimateCRM:
             logger.log(f"Archive lead error: {e}", "ERROR")
             return {"success": False, "message": f"Error: {str(e)}"}
         finally:
-            conn.close()
+            self.release_connection(conn)
     
     def get_statistics(self, period: str = "30d") -> Dict:
         """Get comprehensive statistics"""
-        conn = self.get_connection()
+        conn = self.get_read_connection()
         cursor = conn.cursor()
         
         try:
@@ -1496,143 +2069,70 @@ class UltimateCRM:
             else:
                 date_filter = "30 day"  # Default
             
-            # Overall statistics
-            cursor.execute(f'''
-                SELECT 
-                    COUNT(*) as total_leads,
-                    SUM(CASE WHEN lead_status = 'New Lead' THEN 1 ELSE 0 END) as new_leads,
-                    SUM(CASE WHEN lead_status = 'Contacted' THEN 1 ELSE 0 END) as contacted_leads,
-                    SUM(CASE WHEN lead_status IN ('Meeting Scheduled', 'Zoom Meeting') THEN 1 ELSE 0 END) as meetings_scheduled,
-                    SUM(CASE WHEN lead_status = 'Closed (Won)' THEN 1 ELSE 0 END) as closed_won,
-                    SUM(CASE WHEN lead_status = 'Closed (Lost)' THEN 1 ELSE 0 END) as closed_lost,
-                    SUM(potential_value) as total_potential_value,
-                    AVG(lead_score) as average_score,
-                    COUNT(DISTINCT city) as cities_covered,
-                    COUNT(DISTINCT industry) as industries_covered
-                FROM leads 
-                WHERE is_archived = 0 AND created_at >= DATE('now', '-{date_filter}')
-            ''')
+            # One pass over the period's active leads; every breakdown is a GROUP BY over it
+            cursor.execute(self.STATISTICS_QUERY, (f"-{date_filter}",))
+            groups = {kind: [] for kind in ("status", "quality", "website", "day", "city", "industry")}
+            for row in cursor.fetchall():
+                groups[row["kind"]].append(row)
             
-            overall = cursor.fetchone()
-            stats["overall"] = dict(overall) if overall else {}
+            def avg_score(row) -> Optional[float]:
+                return row["score_sum"] / row["score_n"] if row["score_n"] else None
             
-            # Lead quality distribution
-            cursor.execute(f'''
-                SELECT 
-                    quality_tier,
-                    COUNT(*) as count,
-                    AVG(lead_score) as avg_score,
-                    SUM(potential_value) as total_value
-                FROM leads 
-                WHERE is_archived = 0 AND created_at >= DATE('now', '-{date_filter}')
-                GROUP BY quality_tier
-                ORDER BY 
-                    CASE quality_tier
-                        WHEN 'Premium' THEN 1
-                        WHEN 'High' THEN 2
-                        WHEN 'Medium' THEN 3
-                        WHEN 'Low' THEN 4
-                        ELSE 5
-                    END
-            ''')
+            def total(rows, column: str):
+                values = [row[column] for row in rows if row[column] is not None]
+                return sum(values) if values else None
             
+            # Overall statistics
+            status_rows = groups["status"]
+            status_counts = {row["label"]: row["count"] for row in status_rows}
+            has_leads = bool(status_rows)
+            score_n = sum(row["score_n"] for row in status_rows)
+            stats["overall"] = {
+                "total_leads": sum(status_counts.values()),
+                "new_leads": status_counts.get("New Lead", 0) if has_leads else None,
+                "contacted_leads": status_counts.get("Contacted", 0) if has_leads else None,
+                "meetings_scheduled": (status_counts.get("Meeting Scheduled", 0) +
+                                       status_counts.get("Zoom Meeting", 0)) if has_leads else None,
+                "closed_won": status_counts.get("Closed (Won)", 0) if has_leads else None,
+                "closed_lost": status_counts.get("Closed (Lost)", 0) if has_leads else None,
+                "total_potential_value": total(status_rows, "value_sum"),
+                "average_score": total(status_rows, "score_sum") / score_n if score_n else None,
+                "cities_covered": sum(1 for row in groups["city"] if row["label"] is not None),
+                "industries_covered": sum(1 for row in groups["industry"] if row["label"] is not None)
+            }
+            
+            # Lead quality distribution
             stats["quality_distribution"] = [
-                dict(row) for row in cursor.fetchall()
+                {"quality_tier": row["label"], "count": row["count"],
+                 "avg_score": avg_score(row), "total_value": row["value_sum"]}
+                for row in sorted(groups["quality"], key=lambda row: self.QUALITY_TIER_ORDER.get(row["label"], 5))
             ]
             
             # Website status distribution
-            cursor.execute(f'''
-                SELECT 
-                    website_status,
-                    COUNT(*) as count,
-                    AVG(lead_score) as avg_score
-                FROM leads 
-                WHERE is_archived = 0 AND created_at >= DATE('now', '-{date_filter}')
-                GROUP BY website_status
-                ORDER BY count DESC
-            ''')
-            
             stats["website_status_distribution"] = [
-                dict(row) for row in cursor.fetchall()
+                {"website_status": row["label"], "count": row["count"], "avg_score": avg_score(row)}
+                for row in sorted(groups["website"], key=lambda row: row["count"], reverse=True)
             ]
             
-            # Daily leads trend
-            cursor.execute(f'''
-                SELECT 
-                    DATE(created_at) as date,
-                    COUNT(*) as leads_count,
-                    SUM(CASE WHEN lead_status = 'New Lead' THEN 1 ELSE 0 END) as new_leads,
-                    SUM(CASE WHEN quality_tier IN ('Premium', 'High') THEN 1 ELSE 0 END) as premium_leads
-                FROM leads 
-                WHERE is_archived = 0 AND created_at >= DATE('now', '-{date_filter}')
-                GROUP BY DATE(created_at)
-                ORDER BY date
-            ''')
-            
+            # Daily leads trend, oldest first (GROUP BY output order is not guaranteed)
             stats["daily_trend"] = [
-                dict(row) for row in cursor.fetchall()
+                {"date": row["label"], "leads_count": row["count"],
+                 "new_leads": row["new_leads"], "premium_leads": row["premium_leads"]}
+                for row in sorted(groups["day"], key=lambda row: row["label"] or "")
             ]
             
-            # Top cities
-            cursor.execute(f'''
-                SELECT 
-                    city,
-                    COUNT(*) as lead_count,
-                    AVG(lead_score) as avg_score,
-                    SUM(potential_value) as total_value
-                FROM leads 
-                WHERE is_archived = 0 AND created_at >= DATE('now', '-{date_filter}')
-                GROUP BY city
-                ORDER BY lead_count DESC
-                LIMIT 10
-            ''')
-            
-            stats["top_cities"] = [
-                dict(row) for row in cursor.fetchall()
-            ]
-            
-            # Top industries
-            cursor.execute(f'''
-                SELECT 
-                    industry,
-                    COUNT(*) as lead_count,
-                    AVG(lead_score) as avg_score,
-                    SUM(potential_value) as total_value
-                FROM leads 
-                WHERE is_archived = 0 AND created_at >= DATE('now', '-{date_filter}')
-                GROUP BY industry
-                ORDER BY lead_count DESC
-                LIMIT 10
-            ''')
-            
-            stats["top_industries"] = [
-                dict(row) for row in cursor.fetchall()
-            ]
+            # Top cities and industries
+            for kind, key, stat_key in (("city", "city", "top_cities"), ("industry", "industry", "top_industries")):
+                stats[stat_key] = [
+                    {key: row["label"], "lead_count": row["count"],
+                     "avg_score": avg_score(row), "total_value": row["value_sum"]}
+                    for row in sorted(groups[kind], key=lambda row: row["count"], reverse=True)[:10]
+                ]
             
             # Conversion funnel
-            cursor.execute(f'''
-                SELECT 
-                    lead_status as stage,
-                    COUNT(*) as count,
-                    AVG(lead_score) as avg_score
-                FROM leads 
-                WHERE is_archived = 0 AND created_at >= DATE('now', '-{date_filter}')
-                GROUP BY lead_status
-                ORDER BY 
-                    CASE lead_status
-                        WHEN 'New Lead' THEN 1
-                        WHEN 'Contacted' THEN 2
-                        WHEN 'Follow Up' THEN 3
-                        WHEN 'Meeting Scheduled' THEN 4
-                        WHEN 'Zoom Meeting' THEN 5
-                        WHEN 'Closed (Won)' THEN 6
-                        WHEN 'Closed (Lost)' THEN 7
-                        ELSE 8
-                    END
-            ''')
-            
             stats["conversion_funnel"] = [
-                dict(row) for row in cursor.fetchall()
+                {"stage": row["label"], "count": row["count"], "avg_score": avg_score(row)}
+                for row in sorted(status_rows, key=lambda row: self.FUNNEL_STAGE_ORDER.get(row["label"], 8))
             ]
             
             return stats
@@ -1641,22 +2141,22 @@ class UltimateCRM:
             logger.log(f"Statistics error: {e}", "ERROR")
             return {}
         finally:
-            conn.close()
+            self.release_connection(conn)
     
     def get_today_stats(self) -> Dict:
         """Get today's statistics"""
-        conn = self.get_connection()
+        conn = self.get_read_connection()
         cursor = conn.cursor()
         
         try:
             cursor.execute('''
                 SELECT 
                     COUNT(*) as today_leads,
-                    SUM(CASE WHEN website_status IN ('no_website', 'broken', 'parked') THEN 1 ELSE 0 END) as high_intent_leads,
-                    SUM(CASE WHEN quality_tier IN ('Premium', 'High') THEN 1 ELSE 0 END) as premium_leads,
+                    COUNT(*) FILTER (WHERE website_status IN ('no_website', 'broken', 'parked')) as high_intent_leads,
+                    COUNT(*) FILTER (WHERE quality_tier IN ('Premium', 'High')) as premium_leads,
                     SUM(potential_value) as today_value
                 FROM leads 
-                WHERE DATE(created_at) = DATE('now') AND is_archived = 0
+                WHERE created_at >= DATE('now') AND is_archived = 0
             ''')
             
             result = cursor.fetchone()
@@ -1666,10 +2166,183 @@ class UltimateCRM:
             logger.log(f"Today stats error: {e}", "ERROR")
             return {}
         finally:
-            conn.close()
+            self.release_connection(conn)
+    
+    def get_leads_summary(self, filters: Dict = None) -> Dict:
+        """Aggregate metrics over every lead matching the filters in a single query"""
+        conn = self.get_read_connection()
+        cursor = conn.cursor()
+        
+        try:
+            conditions, params = self.build_filter_conditions(filters)
+            query = '''
+                SELECT 
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE l.website_status IN ('no_website', 'broken', 'parked')) as high_intent,
+                    COUNT(*) FILTER (WHERE l.quality_tier IN ('Premium', 'High')) as premium,
+                    COALESCE(AVG(l.lead_score), 0) as avg_score,
+                    COALESCE(SUM(l.potential_value), 0) as total_value
+                FROM leads l
+                WHERE l.is_archived = 0
+            '''
+            if conditions:
+                query += " AND " + " AND ".join(conditions)
+            
+            cursor.execute(query, params)
+            return dict(cursor.fetchone())
+            
+        except Exception as e:
+            logger.log(f"Leads summary error: {e}", "ERROR")
+            return {"total": 0, "high_intent": 0, "premium": 0, "avg_score": 0, "total_value": 0}
+        finally:
+            self.release_connection(conn)
+    
+    def get_total_count(self) -> int:
+        """Get the number of active leads without fetching any rows"""
+        conn = self.get_read_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT COUNT(*) FROM leads WHERE is_archived = 0')
+            return cursor.fetchone()[0]
+            
+        except Exception as e:
+            logger.log(f"Total count error: {e}", "ERROR")
+            return 0
+        finally:
+            self.release_connection(conn)
 
 # Initialize CRM
-crm = UltimateCRM()
+@st.cache_resource(show_spinner=False)
+def get_crm() -> UltimateCRM:
+    """Get the CRM shared across sessions and reruns, so migrations run and the pool is built once per process"""
+    crm = UltimateCRM()
+    atexit.register(crm.close)
+    return crm
+
+crm = get_crm()
+
+# ============================================================================
+# DASHBOARD DATA CACHE
+# ============================================================================
+
+def get_db_version() -> float:
+    """Get a cache key that changes whenever the database is written"""
+    version = 0.0
+    for path in (crm.db_file, f"{crm.db_file}-wal"):
+        try:
+            version = max(version, os.path.getmtime(path))
+        except OSError:
+            pass
+    return version
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_statistics(period: str, db_version: float) -> Dict:
+    """Get CRM statistics, cached until the database changes"""
+    return crm.get_statistics(period)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_recent_leads(per_page: int, db_version: float) -> Dict:
+    """Get the most recent leads, cached until the database changes"""
+    return crm.get_leads(page=1, per_page=per_page, columns=tuple(RECENT_LEADS_COLUMNS.values()))
+
+def get_log_version() -> float:
+    """Get a cache key that changes whenever the log file is written"""
+    try:
+        return os.path.getmtime(logger.log_file)
+    except OSError:
+        return 0.0
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_recent_logs(limit: int, log_version: float) -> Tuple[List[Dict], Dict[str, List[int]], List[str]]:
+    """Get recent logs with pre-escaped messages, a level -> positions index and lowercased messages, cached until the log changes"""
+    logs = logger.get_recent_logs(limit=limit)
+    level_index = {}
+    messages_lower = []
+    for position, entry in enumerate(logs):
+        message = entry.get("message", "")
+        entry["message_html"] = html.escape(message)
+        level_index.setdefault(entry["level"], []).append(position)
+        messages_lower.append(message.lower())
+    return logs, level_index, messages_lower
+
+def make_filters_key(filters: Dict) -> Tuple:
+    """Convert a leads filter dict into a hashable, order-independent cache key"""
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in filters.items()
+    ))
+
+@st.cache_data(ttl=30, max_entries=32, show_spinner=False)
+def cached_get_leads(filters_key: Tuple, page: int, per_page: int, db_version: float,
+                     columns: Optional[Tuple[str, ...]] = None) -> Dict:
+    """Get a filtered page of leads, cached until the database changes"""
+    filters = {key: list(value) if isinstance(value, tuple) else value for key, value in filters_key}
+    return crm.get_leads(filters=filters, page=page, per_page=per_page, columns=columns)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_leads_summary(filters_key: Tuple, db_version: float) -> Dict:
+    """Get aggregate metrics over all leads matching a filter set, cached until the database changes"""
+    filters = {key: list(value) if isinstance(value, tuple) else value for key, value in filters_key}
+    return crm.get_leads_summary(filters=filters)
+
+@st.cache_data(ttl=10, show_spinner=False)
+def cached_lead_by_id(lead_id: int, db_version: float) -> Optional[Dict]:
+    """Get a single lead with its activities, cached until the database changes"""
+    return crm.get_lead_by_id(lead_id)
+
+@st.cache_data(ttl=15, show_spinner=False)
+def cached_sidebar_counts(db_version: float) -> Tuple[Dict, int]:
+    """Get today's statistics and the total lead count for the sidebar"""
+    return crm.get_today_stats(), crm.get_total_count()
+
+def clear_dashboard_cache():
+    """Drop all cached dashboard data"""
+    cached_statistics.clear()
+    cached_recent_leads.clear()
+    cached_sidebar_counts.clear()
+    cached_get_leads.clear()
+    cached_leads_summary.clear()
+    cached_lead_by_id.clear()
+
+@st.cache_resource(show_spinner=False)
+def get_background_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the small thread pool used to overlap dashboard queries, shared across reruns"""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="dashboard")
+
+def submit_background(func, *args, **kwargs) -> concurrent.futures.Future:
+    """Run func on the background executor with the current session's script context attached"""
+    ctx = get_script_run_ctx()
+    
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return func(*args, **kwargs)
+    
+    return get_background_executor().submit(run)
+
+def st_fragment(run_every: Optional[float] = None):
+    """Scope reruns to the decorated function where Streamlit supports fragments"""
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if fragment is None:
+        # Older Streamlit: render as part of the normal script run
+        return lambda func: func
+    return fragment(run_every=run_every)
+
+def render_html(markup: str):
+    """Emit raw HTML, bypassing the markdown pipeline where Streamlit supports st.html"""
+    if hasattr(st, "html"):
+        st.html(markup)
+    else:
+        st.markdown(markup, unsafe_allow_html=True)
+
+def get_query_param(name: str) -> Optional[str]:
+    """Read a single URL query parameter on both current and older Streamlit"""
+    query_params = getattr(st, "query_params", None)
+    if query_params is not None:
+        return query_params.get(name)
+    # Older Streamlit returns a dict of lists
+    values = st.experimental_get_query_params().get(name)
+    return values[0] if values else None
 
 # ============================================================================
 # WEBSITE CHECKER WITH ADVANCED ANALYSIS
@@ -1678,6 +2351,31 @@ crm = UltimateCRM()
 class AdvancedWebsiteChecker:
     """Advanced website checker with multiple verification methods"""
     
+    # Contact detection patterns, compiled once for every page checked
+    # Covers plain, parenthesised and +1-prefixed numbers (any +1 match contains a bare match)
+    PHONE_PATTERN = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+    EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    PARKED_INDICATORS = KeywordMatcher((
+        'domain for sale', 'parked domain', 'this domain is',
+        'godaddy', 'namecheap', 'hostinger', 'domain parking',
+        'buy this domain', 'is for sale', 'domainparking',
+        'sedoparking', 'parkingcrew', 'above.com', 'voodoo.com',
+        'bodis.com', 'domainname', 'premium domain'
+    ))
+    PLACEHOLDER_INDICATORS = KeywordMatcher((
+        'coming soon', 'under construction', 'website coming soon',
+        'site under maintenance', 'be right back', 'this site is',
+        'page is being', 'will be back', 'temporarily unavailable',
+        'check back soon', 'site is under', 'we are working'
+    ))
+    UNCACHED_STATUSES = frozenset({'timeout', 'error'})
+    CONTACT_FORM_KEYWORDS = KeywordMatcher((
+        'contact', 'message', 'inquiry', 'request', 'quote',
+        'consultation', 'estimate', 'callback', 'reach out'
+    ))
+    # Only the tags the soup-based checks read (title, viewport meta, forms with their fields)
+    PAGE_STRAINER = SoupStrainer(['title', 'meta', 'form'])
+    
     def __init__(self):
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -1689,6 +2387,7 @@ class AdvancedWebsiteChecker:
         self.timeout = CONFIG.request_timeout
         self.proxies = CONFIG.performance.get("proxy_list", [])
         self.current_proxy_idx = 0
+        self.check_cache = {}  # url -> [checked_at, result]; the scraper persists it with its cache file
     
     def get_next_proxy(self):
         """Get next proxy from pool"""
@@ -1699,8 +2398,42 @@ class AdvancedWebsiteChecker:
         self.current_proxy_idx = (self.current_proxy_idx + 1) % len(self.proxies)
         return proxy
     
-    async def check_website_async(self, url: str) -> Dict:
-        """Check website asynchronously"""
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create a shared HTTP session with a bounded, DNS-caching connector"""
+        connector = aiohttp.TCPConnector(
+            limit=CONFIG.performance.get("connection_limit", 100),
+            limit_per_host=CONFIG.performance.get("connection_limit_per_host", 4),
+            ttl_dns_cache=CONFIG.performance.get("dns_cache_ttl", 300),
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+    
+    async def check_website_async(self, url: str, session: Optional[aiohttp.ClientSession] = None) -> Dict:
+        """Check website asynchronously, serving recent results for the same URL from the check cache"""
+        caching = CONFIG.performance.get("enable_caching", True)
+        if caching:
+            cached = self.check_cache.get(url)
+            if cached and time.time() - cached[0] < CONFIG.performance.get("cache_ttl", 3600):
+                return dict(cached[1])
+        
+        result = await self.fetch_website_check(url, session)
+        
+        # Timeouts and unexpected errors are often transient, so those are re-checked next time
+        if caching and result["status"] not in self.UNCACHED_STATUSES:
+            self.check_cache[url] = [time.time(), result]
+        return result
+    
+    def prune_check_cache(self):
+        """Drop check results older than the cache TTL"""
+        cutoff = time.time() - CONFIG.performance.get("cache_ttl", 3600)
+        for url in [url for url, (checked_at, _) in self.check_cache.items() if checked_at < cutoff]:
+            del self.check_cache[url]
+    
+    async def fetch_website_check(self, url: str, session: Optional[aiohttp.ClientSession] = None) -> Dict:
+        """Fetch and analyze a website, reusing the given session when provided"""
         result = {
             "url": url,
             "status": "unknown",
@@ -1733,9 +2466,12 @@ class AdvancedWebsiteChecker:
             }
             
             start_time = time.time()
+            owns_session = session is None
+            if owns_session:
+                session = self.create_session()
             
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(url, timeout=self.timeout, ssl=False) as response:
+            try:
+                async with session.get(url, headers=headers, ssl=False) as response:
                     result["status_code"] = response.status
                     result["load_time"] = time.time() - start_time
                     
@@ -1745,40 +2481,23 @@ class AdvancedWebsiteChecker:
                     
                     # Get page content
                     html_content = await response.text()
-                    
-                    # Check for parked domains
-                    if self.is_parked_domain(html_content):
-                        result["is_parked"] = True
-                        result["status"] = "parked"
-                        return result
-                    
-                    # Check for placeholder pages
-                    if self.is_placeholder_page(html_content):
-                        result["is_placeholder"] = True
-                        result["status"] = "placeholder"
-                        return result
-                    
-                    # Parse HTML
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # Extract title
-                    if soup.title and soup.title.string:
-                        result["title"] = soup.title.string.strip()[:200]
-                    
-                    # Check for contact information
-                    result["has_contact_form"] = self.has_contact_form(soup)
-                    result["has_phone"] = self.has_phone_number(html_content)
-                    result["has_email"] = self.has_email_address(html_content)
-                    
-                    # Check if responsive (has viewport meta tag)
-                    result["responsive"] = self.is_responsive(soup)
-                    
-                    # Check SSL (if HTTPS)
-                    if url.startswith('https://'):
-                        result["ssl_valid"] = await self.check_ssl_async(url)
-                    
-                    result["status"] = "active"
-                    
+            finally:
+                if owns_session:
+                    await session.close()
+            
+            # Parse off the event loop so slow pages don't stall other checks
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.analyze_html, html_content, result)
+            
+            if result["status"] in ("parked", "placeholder"):
+                return result
+            
+            # Check SSL (if HTTPS)
+            if url.startswith('https://'):
+                result["ssl_valid"] = await self.check_ssl_async(url)
+            
+            result["status"] = "active"
+            
         except asyncio.TimeoutError:
             result["status"] = "timeout"
             result["error"] = "Request timed out"
@@ -1791,7 +2510,44 @@ class AdvancedWebsiteChecker:
         
         return result
     
+    def analyze_html(self, html_content: str, result: Dict):
+        """Fill page analysis fields of a check result from raw HTML"""
+        # Lowercase once for every keyword check
+        content_lower = html_content.lower()
+        
+        # Check for parked domains
+        if self.is_parked_domain(content_lower):
+            result["is_parked"] = True
+            result["status"] = "parked"
+            return
+        
+        # Check for placeholder pages
+        if self.is_placeholder_page(content_lower):
+            result["is_placeholder"] = True
+            result["status"] = "placeholder"
+            return
+        
+        # Parse HTML
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=self.PAGE_STRAINER)
+        
+        # Extract title
+        if soup.title and soup.title.string:
+            result["title"] = soup.title.string.strip()[:200]
+        
+        # Check for contact information
+        result["has_contact_form"] = self.has_contact_form(soup)
+        result["has_phone"] = self.has_phone_number(html_content)
+        result["has_email"] = self.has_email_address(html_content)
+        
+        # Check if responsive (has viewport meta tag)
+        result["responsive"] = self.is_responsive(soup)
+    
     async def check_ssl_async(self, url: str) -> bool:
+        """Check SSL certificate validity without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.check_ssl, url)
+    
+    def check_ssl(self, url: str) -> bool:
         """Check SSL certificate validity"""
         try:
             hostname = urlparse(url).hostname
@@ -1816,32 +2572,13 @@ class AdvancedWebsiteChecker:
         except:
             return False
     
-    def is_parked_domain(self, html_content: str) -> bool:
-        """Check if domain is parked"""
-        content_lower = html_content.lower()
-        
-        parked_indicators = [
-            'domain for sale', 'parked domain', 'this domain is',
-            'godaddy', 'namecheap', 'hostinger', 'domain parking',
-            'buy this domain', 'is for sale', 'domainparking',
-            'sedoparking', 'parkingcrew', 'above.com', 'voodoo.com',
-            'bodis.com', 'domainname', 'premium domain'
-        ]
-        
-        return any(indicator in content_lower for indicator in parked_indicators)
+    def is_parked_domain(self, content_lower: str) -> bool:
+        """Check if domain is parked (content must already be lowercased)"""
+        return self.PARKED_INDICATORS.search(content_lower)
     
-    def is_placeholder_page(self, html_content: str) -> bool:
-        """Check if page is a placeholder"""
-        content_lower = html_content.lower()
-        
-        placeholder_indicators = [
-            'coming soon', 'under construction', 'website coming soon',
-            'site under maintenance', 'be right back', 'this site is',
-            'page is being', 'will be back', 'temporarily unavailable',
-            'check back soon', 'site is under', 'we are working'
-        ]
-        
-        return any(indicator in content_lower for indicator in placeholder_indicators)
+    def is_placeholder_page(self, content_lower: str) -> bool:
+        """Check if page is a placeholder (content must already be lowercased)"""
+        return self.PLACEHOLDER_INDICATORS.search(content_lower)
     
     def has_contact_form(self, soup) -> bool:
         """Check if page has contact form"""
@@ -1852,12 +2589,7 @@ class AdvancedWebsiteChecker:
             form_html = str(form).lower()
             
             # Check for contact-related keywords
-            contact_keywords = [
-                'contact', 'message', 'inquiry', 'request', 'quote',
-                'consultation', 'estimate', 'callback', 'reach out'
-            ]
-            
-            if any(keyword in form_html for keyword in contact_keywords):
+            if self.CONTACT_FORM_KEYWORDS.search(form_html):
                 return True
             
             # Check for common contact form fields
@@ -1874,22 +2606,11 @@ class AdvancedWebsiteChecker:
     
     def has_phone_number(self, html_content: str) -> bool:
         """Check if page has phone number"""
-        phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\+1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        ]
-        
-        for pattern in phone_patterns:
-            if re.search(pattern, html_content):
-                return True
-        
-        return False
+        return bool(self.PHONE_PATTERN.search(html_content))
     
     def has_email_address(self, html_content: str) -> bool:
         """Check if page has email address"""
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        return bool(re.search(email_pattern, html_content))
+        return bool(self.EMAIL_PATTERN.search(html_content))
     
     def is_responsive(self, soup) -> bool:
         """Check if page is responsive (has viewport meta tag)"""
@@ -1903,27 +2624,36 @@ class AdvancedWebsiteChecker:
 class PlatformScraper:
     """Base class for platform scrapers"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
     
     def extract_business_info(self, soup, platform: str) -> Dict:
         """Extract business information from platform page"""
         raise NotImplementedError
     
-    def search_businesses(self, query: str, location: str = None, limit: int = 20) -> List[Dict]:
+    async def fetch_page(self, session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None) -> str:
+        """Fetch a search page over the shared aiohttp session"""
+        async with session.get(url, params=params, headers=self.HEADERS, timeout=self.REQUEST_TIMEOUT) as response:
+            return await response.text(errors='replace')
+    
+    async def search_businesses(self, session: aiohttp.ClientSession, query: str,
+                                location: str = None, limit: int = 20) -> List[Dict]:
         """Search for businesses on platform"""
         raise NotImplementedError
 
 class GoogleBusinessScraper(PlatformScraper):
     """Google Business Profile scraper"""
     
-    def search_businesses(self, query: str, location: str = None, limit: int = 20) -> List[Dict]:
+    # Result markup class names, compiled once rather than per search / per result
+    RESULT_CLASS_PATTERN = re.compile(r'(VkpGBb|dbg0pd|iUh30|rc)')
+    SNIPPET_CLASS_PATTERN = re.compile(r's3v9rd|VwiC3b')
+    RESULT_STRAINER = SoupStrainer('div', class_=RESULT_CLASS_PATTERN)
+    
+    async def search_businesses(self, session: aiohttp.ClientSession, query: str,
+                                location: str = None, limit: int = 20) -> List[Dict]:
         """Search Google for businesses"""
-        results = []
-        
         try:
             search_query = f"{query}"
             if location:
@@ -1936,25 +2666,29 @@ class GoogleBusinessScraper(PlatformScraper):
                 'hl': 'en'
             }
             
-            response = self.session.get(
-                'https://www.google.com/search',
-                params=params,
-                timeout=10
-            )
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            html = await self.fetch_page(session, 'https://www.google.com/search', params)
             
-            # Extract business results (simplified - would need more sophisticated parsing)
-            # Look for business listings
-            business_divs = soup.find_all('div', class_=re.compile(r'(VkpGBb|dbg0pd|iUh30|rc)'))
-            
-            for div in business_divs[:limit]:
-                business_info = self.extract_from_google_div(div)
-                if business_info:
-                    results.append(business_info)
+            # Parse off the event loop so other fetches keep flowing
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.parse_results, html, limit)
             
         except Exception as e:
             logger.log(f"Google search error: {e}", "ERROR")
+            return []
+    
+    def parse_results(self, html: str, limit: int) -> List[Dict]:
+        """Extract business results from a Google results page"""
+        results = []
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=self.RESULT_STRAINER)
+        
+        # Extract business results (simplified - would need more sophisticated parsing)
+        # Look for business listings
+        business_divs = soup.find_all('div', class_=self.RESULT_CLASS_PATTERN)
+        
+        for div in business_divs[:limit]:
+            business_info = self.extract_from_google_div(div)
+            if business_info:
+                results.append(business_info)
         
         return results
     
@@ -1981,7 +2715,7 @@ class GoogleBusinessScraper(PlatformScraper):
                     business['url'] = href
             
             # Extract snippet
-            snippet_elem = div.find('div', class_=re.compile('s3v9rd|VwiC3b'))
+            snippet_elem = div.find('div', class_=self.SNIPPET_CLASS_PATTERN)
             if snippet_elem:
                 business['snippet'] = snippet_elem.get_text(strip=True)[:200]
             
@@ -1999,28 +2733,37 @@ class GoogleBusinessScraper(PlatformScraper):
 class FacebookScraper(PlatformScraper):
     """Facebook Business Page scraper"""
     
-    def search_businesses(self, query: str, location: str = None, limit: int = 20) -> List[Dict]:
+    PROFILE_STRAINER = SoupStrainer('div', class_='_2ph_')
+    
+    async def search_businesses(self, session: aiohttp.ClientSession, query: str,
+                                location: str = None, limit: int = 20) -> List[Dict]:
         """Search Facebook for business pages"""
-        results = []
-        
         try:
             # Facebook search requires authentication
             # This is a simplified version
             search_url = f"https://www.facebook.com/public/{query.replace(' ', '-')}"
             
-            response = self.session.get(search_url, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract business pages (simplified)
-            profile_divs = soup.find_all('div', class_='_2ph_')
+            html = await self.fetch_page(session, search_url)
             
-            for div in profile_divs[:limit]:
-                business_info = self.extract_from_facebook_div(div)
-                if business_info:
-                    results.append(business_info)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.parse_results, html, limit)
             
         except Exception as e:
             logger.log(f"Facebook search error: {e}", "ERROR")
+            return []
+    
+    def parse_results(self, html: str, limit: int) -> List[Dict]:
+        """Extract business pages from a Facebook results page"""
+        results = []
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=self.PROFILE_STRAINER)
+        
+        # Extract business pages (simplified)
+        profile_divs = soup.find_all('div', class_='_2ph_')
+        
+        for div in profile_divs[:limit]:
+            business_info = self.extract_from_facebook_div(div)
+            if business_info:
+                results.append(business_info)
         
         return results
     
@@ -2048,10 +2791,16 @@ class FacebookScraper(PlatformScraper):
 class LeadQualificationEngine:
     """AI-powered lead qualification engine"""
     
+    JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)  # JSON embedded in a chatty AI reply
+    
+    # Quality tier by lead score: a score at or above QUALITY_SCORE_THRESHOLDS[i] earns QUALITY_TIERS[i + 1]
+    QUALITY_SCORE_THRESHOLDS = (40, 60, 75, 90)
+    QUALITY_TIERS = ("Unknown", "Low", "Medium", "High", "Premium")
+    
     def __init__(self):
         self.openai_client = None
         
-        if OPENAI_AVAILABLE and CONFIG.api.openai_api_key:
+        if AI_ENRICHMENT_ACTIVE:
             try:
                 self.openai_client = openai.OpenAI(api_key=CONFIG.api.openai_api_key)
             except Exception as e:
@@ -2209,7 +2958,7 @@ class LeadQualificationEngine:
                 return ai_data
             except json.JSONDecodeError:
                 # Try to extract JSON from text
-                json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
+                json_match = self.JSON_OBJECT_PATTERN.search(ai_response)
                 if json_match:
                     ai_data = json.loads(json_match.group())
                     return ai_data
@@ -2223,16 +2972,7 @@ class LeadQualificationEngine:
     
     def determine_quality_tier(self, score: int) -> str:
         """Determine quality tier based on score"""
-        if score >= 90:
-            return "Premium"
-        elif score >= 75:
-            return "High"
-        elif score >= 60:
-            return "Medium"
-        elif score >= 40:
-            return "Low"
-        else:
-            return "Unknown"
+        return self.QUALITY_TIERS[bisect.bisect_right(self.QUALITY_SCORE_THRESHOLDS, score)]
     
     def generate_outreach_template(self, lead_data: Dict, template_type: str = "email") -> Dict:
         """Generate personalized outreach template"""
@@ -2298,6 +3038,19 @@ class LeadQualificationEngine:
 class UltimateLeadScraper:
     """Main lead scraper engine with multiple modes and platforms"""
     
+    # Potential value multiplier by quality tier (any other tier counts as 1)
+    TIER_VALUE_MULTIPLIERS = {'Premium': 10, 'High': 5, 'Medium': 2}
+    HIGH_INTENT_WEBSITE_STATUSES = frozenset({'no_website', 'broken', 'parked'})
+    HIGH_VALUE_INDUSTRIES = ('contractor', 'construction', 'roofing', 'plumbing')
+    
+    # Outreach priority by lead score: a score at or above PRIORITY_SCORE_THRESHOLDS[i] earns PRIORITY_LEVELS[i + 1]
+    PRIORITY_SCORE_THRESHOLDS = (60, 75, 90)
+    PRIORITY_LEVELS = ('Low', 'Medium', 'High', 'Immediate')
+    
+    # Lead files (storage key -> newest leads kept); each is compacted once it holds twice its limit
+    LEAD_FILE_LIMITS = {'leads_file': 5000, 'qualified_leads': 1000, 'premium_leads': 500}
+    CACHE_SAVE_INTERVAL = 60  # Minimum seconds between routine cache file writes
+    
     def __init__(self):
         self.api_key = CONFIG.api.serper_api_key
         self.website_checker = AdvancedWebsiteChecker()
@@ -2321,8 +3074,13 @@ class UltimateLeadScraper:
             'errors': 0
         }
         
+        self.lead_file_lines = {}  # lead file path -> line count, read on first append
+        
         self.cache_file = CONFIG.storage["cache_file"]
+        self.cache_saved_at = 0.0
         self.load_cache()
+        # Website checks persist across cycles and restarts alongside the search cache
+        self.website_checker.check_cache = self.cache.setdefault("website_checks", {})
         
         logger.log(f"✅ Ultimate Lead Scraper initialized in '{self.current_mode}' mode", "SUCCESS")
     
@@ -2331,19 +3089,31 @@ class UltimateLeadScraper:
         self.cache = {}
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'r') as f:
-                    self.cache = json.load(f)
+                with open(self.cache_file, 'rb') as f:
+                    self.cache = json_loads(f.read())
             except:
                 self.cache = {}
     
-    def save_cache(self):
-        """Save search cache"""
+    def save_cache(self, force: bool = False):
+        """Save search cache, at most once per CACHE_SAVE_INTERVAL unless forced"""
+        if not force and time.time() - self.cache_saved_at < self.CACHE_SAVE_INTERVAL:
+            return
+        
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            self.website_checker.prune_check_cache()
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                f.write(json_dumps(self.cache))
+            os.replace(tmp_file, self.cache_file)
+            self.cache_saved_at = time.time()
         except Exception as e:
             logger.log(f"Cache save error: {e}", "WARNING")
     
+    @staticmethod
+    def lead_fingerprint(business_name: str, website: str, phone: str, city: str) -> str:
+        """Fingerprint identifying a business across searches and cycles"""
+        return hashlib.sha256(str((business_name, website, phone, city)).encode()).hexdigest()
+    
     def generate_search_queries(self) -> List[Dict]:
         """Generate search queries based on active mode"""
         queries = []
@@ -2380,48 +3150,69 @@ class UltimateLeadScraper:
         random.shuffle(queries)
         return queries[:CONFIG.searches_per_cycle]
     
-    def search_platforms(self, query_info: Dict) -> List[Dict]:
-        """Search across multiple platforms"""
+    async def search_platforms(self, query_info: Dict, session: aiohttp.ClientSession) -> List[Dict]:
+        """Search across multiple platforms concurrently"""
+        platforms = [p for p in CONFIG.platforms_to_scrape if p in self.platform_scrapers]
         all_results = []
         
-        for platform in CONFIG.platforms_to_scrape:
-            if platform in self.platform_scrapers:
-                try:
-                    logger.log(f"Searching {platform} for: {query_info['query']}", "INFO")
-                    
-                    results = self.platform_scrapers[platform].search_businesses(
-                        query=query_info['query'],
-                        location=query_info['city'],
-                        limit=CONFIG.businesses_per_search // len(CONFIG.platforms_to_scrape)
-                    )
-                    
-                    # Add platform info to results
-                    for result in results:
-                        result['platform'] = platform
-                        result['search_query'] = query_info['query']
-                        result['industry'] = query_info['industry']
-                        result['city'] = query_info['city']
-                        result['state'] = query_info['state']
-                    
-                    all_results.extend(results)
-                    
-                    # Rate limiting
-                    time.sleep(random.uniform(1, 2))
-                    
-                except Exception as e:
-                    logger.log(f"{platform} search error: {e}", "ERROR")
-                    self.stats['errors'] += 1
+        for results in await asyncio.gather(*(self.search_platform(p, query_info, session) for p in platforms)):
+            all_results.extend(results)
         
         return all_results
     
-    async def process_business(self, business_info: Dict) -> Optional[Dict]:
+    async def search_platform(self, platform: str, query_info: Dict, session: aiohttp.ClientSession) -> List[Dict]:
+        """Search a single platform"""
+        try:
+            logger.log(f"Searching {platform} for: {query_info['query']}", "INFO")
+            
+            results = await self.platform_scrapers[platform].search_businesses(
+                session,
+                query=query_info['query'],
+                location=query_info['city'],
+                limit=CONFIG.businesses_per_search // len(CONFIG.platforms_to_scrape)
+            )
+            
+            # Add platform info to results
+            for result in results:
+                result['platform'] = platform
+                result['search_query'] = query_info['query']
+                result['industry'] = query_info['industry']
+                result['city'] = query_info['city']
+                result['state'] = query_info['state']
+            
+            # Rate limiting (per platform, so it only delays this platform's next search)
+            await asyncio.sleep(random.uniform(1, 2))
+            
+            return results
+            
+        except Exception as e:
+            logger.log(f"{platform} search error: {e}", "ERROR")
+            self.stats['errors'] += 1
+            return []
+    
+    async def process_business(self, business_info: Dict,
+                               session: Optional[aiohttp.ClientSession] = None,
+                               semaphore: Optional[asyncio.Semaphore] = None) -> Optional[Dict]:
         """Process a single business into a lead"""
         try:
             # Extract website from business info
             website = business_info.get('url') or business_info.get('website', '')
             
-            # Check website status
-            website_check = await self.website_checker.check_website_async(website)
+            # Skip businesses already in the CRM before paying for a website check
+            fingerprint = self.lead_fingerprint(
+                business_info.get('name', 'Unknown Business'), website,
+                business_info.get('phone', ''), business_info.get('city', '')
+            )
+            if CONFIG.crm.enabled and crm.lead_exists(fingerprint):
+                logger.log(f"Already in CRM: {business_info.get('name', 'Unknown Business')}", "DEBUG")
+                return None
+            
+            # Check website status (bounded by the cycle semaphore when given)
+            if semaphore is not None:
+                async with semaphore:
+                    website_check = await self.website_checker.check_website_async(website, session)
+            else:
+                website_check = await self.website_checker.check_website_async(website, session)
             
             # Apply mode filters
             mode_config = CONFIG.scraper_modes[self.current_mode]
@@ -2485,17 +3276,13 @@ class UltimateLeadScraper:
                 'website_responsive': website_check.get('responsive')
             })
             
-            # Generate fingerprint
-            fingerprint_data = (
-                lead_data['business_name'],
-                lead_data['website'],
-                lead_data['phone'],
-                lead_data['city']
-            )
-            lead_data['fingerprint'] = hashlib.sha256(str(fingerprint_data).encode()).hexdigest()
+            lead_data['fingerprint'] = fingerprint
             
             # Qualify lead
-            qualification = self.qualification_engine.qualify_lead(lead_data)
+            loop = asyncio.get_running_loop()
+            qualification = await loop.run_in_executor(
+                None, self.qualification_engine.qualify_lead, lead_data
+            )
             lead_data.update(qualification)
             
             # Apply quality threshold
@@ -2553,42 +3340,24 @@ class UltimateLeadScraper:
         base_value = 1000
         
         # Adjust based on quality tier
-        tier_multipliers = {
-            'Premium': 10,
-            'High': 5,
-            'Medium': 2,
-            'Low': 1,
-            'Unknown': 1
-        }
-        
-        tier = lead_data.get('quality_tier', 'Unknown')
-        multiplier = tier_multipliers.get(tier, 1)
+        multiplier = self.TIER_VALUE_MULTIPLIERS.get(lead_data.get('quality_tier'), 1)
         
         # Adjust based on website status
-        website_status = lead_data.get('website_status', 'unknown')
-        if website_status in ['no_website', 'broken', 'parked']:
+        if lead_data.get('website_status') in self.HIGH_INTENT_WEBSITE_STATUSES:
             multiplier *= 2
         
         # Adjust based on industry
         industry = lead_data.get('industry', '').lower()
-        if any(ind in industry for ind in ['contractor', 'construction', 'roofing', 'plumbing']):
+        if any(ind in industry for ind in self.HIGH_VALUE_INDUSTRIES):
             multiplier *= 1.5
         
         return int(base_value * multiplier)
     
     def determine_outreach_priority(self, lead_data: Dict) -> str:
         """Determine outreach priority"""
-        score = lead_data.get('lead_score', 0)
-        website_status = lead_data.get('website_status', 'unknown')
-        
-        if score >= 90 or website_status == 'no_website':
+        if lead_data.get('website_status') == 'no_website':
             return 'Immediate'
-        elif score >= 75:
-            return 'High'
-        elif score >= 60:
-            return 'Medium'
-        else:
-            return 'Low'
+        return self.PRIORITY_LEVELS[bisect.bisect_right(self.PRIORITY_SCORE_THRESHOLDS, lead_data.get('lead_score', 0))]
     
     async def run_cycle_async(self):
         """Run a scraping cycle asynchronously"""
@@ -2601,56 +3370,22 @@ class UltimateLeadScraper:
         queries = self.generate_search_queries()
         leads_found = 0
         websites_checked = 0
+        semaphore = asyncio.Semaphore(CONFIG.concurrent_scrapers)
         
-        for query_info in queries:
-            if self.paused or not self.running:
-                break
-            
-            logger.log(f"🔍 Processing query: {query_info['query']}", "INFO")
-            
-            # Search platforms
-            businesses = self.search_platforms(query_info)
-            
-            # Process businesses concurrently
-            tasks = []
-            for business in businesses[:CONFIG.businesses_per_search]:
+        async with self.website_checker.create_session() as session:
+            for query_info in queries:
                 if self.paused or not self.running:
                     break
                 
-                task = asyncio.create_task(self.process_business(business))
-                tasks.append(task)
-                websites_checked += 1
-            
-            # Wait for all tasks to complete
-            if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                found, checked = await self.process_query(query_info, session, semaphore)
+                leads_found += found
+                websites_checked += checked
                 
-                for result in results:
-                    if isinstance(result, Exception):
-                        logger.log(f"Task error: {result}", "ERROR")
-                        continue
-                    
-                    if result:
-                        # Save to CRM
-                        if CONFIG.crm.enabled and CONFIG.crm.auto_sync:
-                            save_result = crm.save_lead(result)
-                            if save_result["success"]:
-                                leads_found += 1
-                                
-                                if result.get('quality_tier') in ['Premium', 'High']:
-                                    self.stats['premium_leads'] += 1
-                                
-                                if result.get('website_status') in ['no_website', 'broken', 'parked']:
-                                    self.stats['high_intent_leads'] += 1
-                                
-                                logger.log(f"✅ Saved lead: {result['business_name']} (Score: {result['lead_score']})", "SUCCESS")
-                        
-                        # Save to JSON file
-                        self.save_lead_to_file(result)
-            
-            # Rate limiting between queries
-            if not self.paused and self.running:
-                await asyncio.sleep(random.uniform(2, 4))
+                # Rate limiting between queries
+                if not self.paused and self.running:
+                    await asyncio.sleep(random.uniform(2, 4))
+        
+        self.save_cache()
         
         # Update statistics
         self.stats['total_cycles'] += 1
@@ -2662,72 +3397,123 @@ class UltimateLeadScraper:
         logger.log(f"✅ Cycle completed. Found {leads_found} leads, checked {websites_checked} websites. "
                   f"Duration: {self.stats['cycle_duration']:.1f}s", "SUCCESS")
     
-    def save_lead_to_file(self, lead_data: Dict):
-        """Save lead to JSON file"""
-        try:
-            leads_file = CONFIG.storage["leads_file"]
-            leads = []
-            
-            if os.path.exists(leads_file):
-                with open(leads_file, 'r') as f:
-                    leads = json.load(f)
-            
-            leads.append(lead_data)
-            
-            # Keep only last 5000 leads
-            if len(leads) > 5000:
-                leads = leads[-5000:]
-            
-            with open(leads_file, 'w') as f:
-                json.dump(leads, f, indent=2, default=str)
-            
-            # Save to qualified leads if above threshold
-            if lead_data.get('lead_score', 0) >= CONFIG.ai_enrichment.qualification_threshold:
-                qualified_file = CONFIG.storage["qualified_leads"]
-                qualified = []
-                
-                if os.path.exists(qualified_file):
-                    with open(qualified_file, 'r') as f:
-                        qualified = json.load(f)
-                
-                qualified.append(lead_data)
-                
-                if len(qualified) > 1000:
-                    qualified = qualified[-1000:]
-                
-                with open(qualified_file, 'w') as f:
-                    json.dump(qualified, f, indent=2, default=str)
-            
-            # Save to premium leads if high quality
-            if lead_data.get('quality_tier') in ['Premium', 'High']:
-                premium_file = CONFIG.storage["premium_leads"]
-                premium = []
-                
-                if os.path.exists(premium_file):
-                    with open(premium_file, 'r') as f:
-                        premium = json.load(f)
-                
-                premium.append(lead_data)
-                
-                if len(premium) > 500:
-                    premium = premium[-500:]
-                
-                with open(premium_file, 'w') as f:
-                    json.dump(premium, f, indent=2, default=str)
+    async def process_query(self, query_info: Dict, session: aiohttp.ClientSession,
+                            semaphore: asyncio.Semaphore) -> Tuple[int, int]:
+        """Search one query and process its businesses concurrently"""
+        logger.log(f"🔍 Processing query: {query_info['query']}", "INFO")
+        leads_found = 0
+        
+        # Search platforms over the shared session
+        businesses = await self.search_platforms(query_info, session)
+        
+        # Process businesses concurrently over the shared session
+        tasks = [
+            self.process_business(business, session, semaphore)
+            for business in businesses[:CONFIG.businesses_per_search]
+        ]
+        if not tasks:
+            return 0, 0
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        leads = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.log(f"Task error: {result}", "ERROR")
+            elif result:
+                leads.append(result)
+        
+        # Save to CRM in one batch on the writer thread, keeping the event loop free
+        if leads and CONFIG.crm.enabled and CONFIG.crm.auto_sync:
+            save_results = await asyncio.wrap_future(crm.queue_leads(leads))
+            for result, save_result in zip(leads, save_results):
+                if save_result["success"]:
+                    leads_found += 1
+                    
+                    if result.get('quality_tier') in ['Premium', 'High']:
+                        self.stats['premium_leads'] += 1
                     
+                    if result.get('website_status') in ['no_website', 'broken', 'parked']:
+                        self.stats['high_intent_leads'] += 1
+                    
+                    logger.log(f"✅ Saved lead: {result['business_name']} (Score: {result['lead_score']})", "SUCCESS")
+        
+        # Append to the JSON lines lead files
+        if leads:
+            self.save_leads_to_files(leads)
+        
+        return leads_found, len(tasks)
+    
+    def save_leads_to_files(self, leads: List[Dict]):
+        """Append leads to the JSON lines lead files (all, qualified and premium)"""
+        try:
+            threshold = CONFIG.ai_enrichment.qualification_threshold
+            self.append_lead_lines("leads_file", leads)
+            self.append_lead_lines("qualified_leads", [
+                lead for lead in leads if lead.get('lead_score', 0) >= threshold
+            ])
+            self.append_lead_lines("premium_leads", [
+                lead for lead in leads if lead.get('quality_tier') in ['Premium', 'High']
+            ])
         except Exception as e:
-            logger.log(f"Error saving lead to file: {e}", "WARNING")
+            logger.log(f"Error saving leads to file: {e}", "WARNING")
+    
+    def append_lead_lines(self, storage_key: str, leads: List[Dict]):
+        """Append leads as JSON lines, keeping only the newest ones once the file outgrows its limit"""
+        if not leads:
+            return
+        
+        path = CONFIG.storage[storage_key]
+        limit = self.LEAD_FILE_LIMITS[storage_key]
+        if path not in self.lead_file_lines:
+            self.lead_file_lines[path] = self.prepare_lead_file(path)
+        
+        with open(path, 'a') as f:
+            f.writelines(json_dumps(lead) + '\n' for lead in leads)
+        self.lead_file_lines[path] += len(leads)
+        
+        # Compact to the newest entries; waiting for 2x the limit keeps this amortized O(1) per lead
+        if self.lead_file_lines[path] > 2 * limit:
+            with open(path, 'r') as f:
+                recent = collections.deque(f, maxlen=limit)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.writelines(recent)
+            os.replace(tmp_path, path)
+            self.lead_file_lines[path] = len(recent)
+    
+    def prepare_lead_file(self, path: str) -> int:
+        """Count a lead file's lines, first converting a legacy JSON array file to JSON lines"""
+        if not os.path.exists(path):
+            return 0
+        
+        with open(path, 'r') as f:
+            if f.read(1) != '[':
+                f.seek(0)
+                return sum(1 for _ in f)
+            f.seek(0)
+            legacy = json_loads(f.read())
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.writelines(json_dumps(lead) + '\n' for lead in legacy)
+        os.replace(tmp_path, path)
+        return len(legacy)
     
     def start(self):
         """Start the scraper"""
         self.running = True
         self.paused = False
+        # Flush the cache on interpreter exit if the scraper is never stopped cleanly
+        atexit.register(self.save_cache, True)
         logger.log("🟢 Scraper started", "SUCCESS")
     
     def stop(self):
         """Stop the scraper"""
         self.running = False
         self.paused = False
+        # The thread running the cycles flushes the cache once it has finished with it
+        atexit.unregister(self.save_cache)
         logger.log("🔴 Scraper stopped", "INFO")
     
     def pause(self):
@@ -2764,317 +3550,70 @@ class UltimateLeadScraper:
             }
         }
 
-# ============================================================================
-# ULTIMATE STREAMLIT DASHBOARD
-# ============================================================================
-
-class UltimateStreamlitDashboard:
-    """Ultimate Streamlit dashboard with all features"""
+class ScraperRunner:
+    """Process-wide background scraper shared by every dashboard session"""
     
     def __init__(self):
-        self.crm = crm
-        self.scraper = None
-        self.scraper_running = False
-        self.scraper_thread = None
-        self.setup_page()
-        
-        logger.log("✅ Ultimate Streamlit Dashboard initialized", "SUCCESS")
+        self.scraper: Optional[UltimateLeadScraper] = None
+        self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.stats: Dict = {}
+        self.mode = CONFIG.active_mode
+    
+    def is_running(self) -> bool:
+        """Check whether the background thread is alive and not stopping"""
+        return self.thread is not None and self.thread.is_alive() and not self.stop_event.is_set()
+    
+    def is_alive(self) -> bool:
+        """Check whether the background thread exists, including while it finishes after a stop"""
+        return self.thread is not None and self.thread.is_alive()
+    
+    def start(self) -> bool:
+        """Start the background scraper thread if it is not already running"""
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return False
+            
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, daemon=True, name="scraper-runner")
+            self.thread.start()
+            return True
     
-    def setup_page(self):
-        """Setup Streamlit page configuration"""
-        st.set_page_config(
-            page_title="Ultimate LeadScraper CRM",
-            page_icon="🚀",
-            layout="wide",
-            initial_sidebar_state="expanded",
-            menu_items={
-                'Get Help': 'https://github.com/yourusername/ultimate-lead-scraper',
-                'Report a bug': 'https://github.com/yourusername/ultimate-lead-scraper/issues',
-                'About': '# Ultimate LeadScraper CRM v2.0\nHigh-Intent Lead Generation System'
-            }
-        )
-        
-        # Apply custom CSS
-        self.setup_custom_css()
-        
-        # Initialize session state
-        if 'initialized' not in st.session_state:
-            st.session_state.initialized = True
-            st.session_state.scraper_running = False
-            st.session_state.scraper_stats = {}
-            st.session_state.current_mode = CONFIG.active_mode
-            st.session_state.lead_filters = {}
-            st.session_state.selected_lead_id = None
-            st.session_state.export_data = None
+    def stop(self) -> bool:
+        """Signal the background scraper to stop after the current step"""
+        self.stop_event.set()
+        if self.scraper:
+            self.scraper.stop()
+        return True
     
-    def setup_custom_css(self):
-        """Setup custom CSS with modern design"""
-        st.markdown("""
-        <style>
-        /* Modern CSS Reset */
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        /* Main Theme Variables */
-        :root {
-            --primary: #0066FF;
-            --primary-dark: #0052CC;
-            --primary-light: #3385FF;
-            --secondary: #00D4AA;
-            --secondary-dark: #00B894;
-            --accent: #FF6B6B;
-            --success: #10B981;
-            --warning: #F59E0B;
-            --danger: #EF4444;
-            --dark: #111827;
-            --dark-light: #1F2937;
-            --dark-lighter: #374151;
-            --light: #F9FAFB;
-            --light-dark: #E5E7EB;
-            --gray: #6B7280;
-        }
-        
-        /* Main Container */
-        .main .block-container {
-            padding-top: 1rem;
-            padding-bottom: 1rem;
-            max-width: 100%;
-        }
-        
-        /* Modern Cards */
-        .modern-card {
-            background: linear-gradient(135deg, rgba(255, 255, 255, 0.1) 0%, rgba(255, 255, 255, 0.05) 100%);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            border-radius: 16px;
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-            transition: all 0.3s ease;
-        }
-        
-        .modern-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.2);
-            border-color: var(--primary-light);
-        }
-        
-        .metric-card {
-            background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
-            border-radius: 12px;
-            padding: 1.5rem;
-            color: white;
-        }
-        
-        .metric-card-secondary {
-            background: linear-gradient(135deg, var(--secondary) 0%, var(--secondary-dark) 100%);
-        }
-        
-        .metric-card-accent {
-            background: linear-gradient(135deg, var(--accent) 0%, #FF4757 100%);
-        }
-        
-        /* Typography */
-        h1, h2, h3, h4, h5, h6 {
-            font-weight: 700 !important;
-            color: var(--light) !important;
-            margin-bottom: 1rem !important;
-        }
-        
-        .subtitle {
-            color: var(--gray) !important;
-            font-weight: 500 !important;
-        }
-        
-        /* Badges */
-        .badge {
-            display: inline-block;
-            padding: 0.35rem 0.75rem;
-            border-radius: 20px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .badge-premium {
-            background: linear-gradient(135deg, #FFD700, #FFA500);
-            color: #000;
-        }
-        
-        .badge-high {
-            background: linear-gradient(135deg, var(--success), #059669);
-            color: white;
-        }
-        
-        .badge-medium {
-            background: linear-gradient(135deg, var(--warning), #D97706);
-            color: white;
-        }
-        
-        .badge-low {
-            background: linear-gradient(135deg, var(--gray), #4B5563);
-            color: white;
-        }
-        
-        .badge-no-website {
-            background: linear-gradient(135deg, var(--accent), #DC2626);
-            color: white;
-        }
-        
-        .badge-broken-website {
-            background: linear-gradient(135deg, #F97316, #EA580C);
-            color: white;
-        }
-        
-        .badge-active-website {
-            background: linear-gradient(135deg, var(--success), #059669);
-            color: white;
-        }
-        
-        /* Buttons */
-        .stButton > button {
-            border-radius: 8px !important;
-            font-weight: 600 !important;
-            transition: all 0.3s ease !important;
-            border: none !important;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3) !important;
-        }
-        
-        /* Data Tables */
-        .dataframe {
-            border-radius: 8px !important;
-            overflow: hidden !important;
-        }
-        
-        .dataframe th {
-            background: linear-gradient(135deg, var(--primary), var(--primary-dark)) !important;
-            color: white !important;
-            font-weight: 600 !important;
-            border: none !important;
-        }
-        
-        .dataframe td {
-            border-color: rgba(255, 255, 255, 0.1) !important;
-            padding: 12px !important;
-        }
-        
-        /* Tabs */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 12px;
-            padding: 4px;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            border-radius: 8px !important;
-            padding: 12px 24px !important;
-            font-weight: 600 !important;
-            transition: all 0.3s ease !important;
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background: linear-gradient(135deg, var(--primary), var(--primary-dark)) !important;
-            color: white !important;
-        }
-        
-        /* Sidebar */
-        section[data-testid="stSidebar"] {
-            background: linear-gradient(180deg, var(--dark) 0%, #0F172A 100%) !important;
-            border-right: 1px solid rgba(255, 255, 255, 0.1) !important;
-        }
-        
-        /* Scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 4px;
-        }
-        
-        ::-webkit-scrollbar-thumb {
-            background: var(--primary);
-            border-radius: 4px;
-        }
-        
-        ::-webkit-scrollbar-thumb:hover {
-            background: var(--primary-light);
-        }
-        
-        /* Hide Streamlit elements */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        
-        /* Animations */
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .fade-in {
-            animation: fadeIn 0.5s ease-out;
-        }
-        
-        /* Status Indicators */
-        .status-dot {
-            display: inline-block;
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }
-        
-        .status-active { background-color: var(--success); }
-        .status-paused { background-color: var(--warning); }
-        .status-stopped { background-color: var(--danger); }
-        
-        /* Form Elements */
-        .stTextInput > div > div > input,
-        .stSelectbox > div > div,
-        .stNumberInput > div > div > input,
-        .stTextArea > div > div > textarea {
-            border-radius: 8px !important;
-            border: 1px solid rgba(255, 255, 255, 0.2) !important;
-            background: rgba(255, 255, 255, 0.05) !important;
-            color: white !important;
-        }
-        
-        /* Loader */
-        .loader {
-            border: 3px solid rgba(255, 255, 255, 0.1);
-            border-top: 3px solid var(--primary);
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        </style>
-        """, unsafe_allow_html=True)
+    def pause(self) -> bool:
+        """Pause the running scraper"""
+        if self.scraper:
+            self.scraper.pause()
+            return True
+        return False
     
-    def run_scraper_background(self):
-        """Run scraper in background thread"""
+    def set_mode(self, mode_name: str):
+        """Set the mode for the current and future scraper runs"""
+        self.mode = mode_name
+        if self.scraper:
+            self.scraper.set_mode(mode_name)
+    
+    def snapshot_stats(self) -> Dict:
+        """Get a copy of the latest scraper status"""
+        with self.lock:
+            return dict(self.stats)
+    
+    def run(self):
+        """Run scraper cycles until stopped or the cycle limit is reached"""
         try:
             self.scraper = UltimateLeadScraper()
+            self.scraper.set_mode(self.mode)
             self.scraper.start()
             
             cycles = 0
-            while self.scraper_running and cycles < CONFIG.max_cycles:
+            while not self.stop_event.is_set() and cycles < CONFIG.max_cycles:
                 if not self.scraper.running:
                     break
                 
@@ -3083,79 +3622,675 @@ class UltimateStreamlitDashboard:
                 
                 cycles += 1
                 
-                # Update session state
-                st.session_state.scraper_stats = self.scraper.get_status()
-                st.session_state.scraper_stats['cycles_completed'] = cycles
+                status = self.scraper.get_status()
+                status['cycles_completed'] = cycles
+                with self.lock:
+                    self.stats = status
                 
-                # Check if we should continue
-                if self.scraper_running and cycles < CONFIG.max_cycles:
-                    time.sleep(CONFIG.cycle_interval)
+                # Wait for the next cycle, waking immediately on stop
+                if cycles < CONFIG.max_cycles:
+                    self.stop_event.wait(CONFIG.cycle_interval)
             
             self.scraper.stop()
-            self.scraper_running = False
-            st.session_state.scraper_running = False
-            
             logger.log("Scraper finished successfully", "SUCCESS")
             
-        except Exception as e:
-            logger.log(f"Background scraper error: {e}", "ERROR")
-            self.scraper_running = False
-            st.session_state.scraper_running = False
+        except Exception as e:
+            logger.log(f"Background scraper error: {e}", "ERROR")
+        finally:
+            # Flush here, on the thread whose event loop writes the cache, never from the UI thread
+            if self.scraper:
+                self.scraper.save_cache(force=True)
+
+@st.cache_resource(show_spinner=False)
+def get_scraper_runner() -> ScraperRunner:
+    """Get the scraper runner shared across sessions and reruns"""
+    return ScraperRunner()
+
+# ============================================================================
+# DASHBOARD STYLES & TEMPLATES
+# ============================================================================
+
+# Sidebar navigation: label -> page key, rendered as a single radio widget
+NAV_OPTIONS = {
+    "📊 Dashboard": "dashboard",
+    "👥 Leads Management": "leads",
+    "🔍 Lead Details": "lead_details",
+    "⚙️ Settings": "settings",
+    "📈 Analytics": "analytics",
+    "📤 Export": "export",
+    "📋 Logs": "logs",
+    "🔄 Automation": "automation"
+}
+NAV_LABELS = list(NAV_OPTIONS)
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+# Static stylesheet, minified once at import instead of shipped verbatim on every rerun
+CUSTOM_CSS = minify_css("""
+<style>
+/* Modern CSS Reset */
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+/* Main Theme Variables */
+:root {
+    --primary: #0066FF;
+    --primary-dark: #0052CC;
+    --primary-light: #3385FF;
+    --secondary: #00D4AA;
+    --secondary-dark: #00B894;
+    --accent: #FF6B6B;
+    --success: #10B981;
+    --warning: #F59E0B;
+    --danger: #EF4444;
+    --dark: #111827;
+    --dark-light: #1F2937;
+    --dark-lighter: #374151;
+    --light: #F9FAFB;
+    --light-dark: #E5E7EB;
+    --gray: #6B7280;
+}
+
+/* Main Container */
+.main .block-container {
+    padding-top: 1rem;
+    padding-bottom: 1rem;
+    max-width: 100%;
+}
+
+/* Modern Cards */
+.modern-card {
+    background: linear-gradient(135deg, rgba(255, 255, 255, 0.1) 0%, rgba(255, 255, 255, 0.05) 100%);
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: 16px;
+    padding: 1.5rem;
+    margin-bottom: 1rem;
+    transition: all 0.3s ease;
+}
+
+.modern-card:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 10px 25px rgba(0, 0, 0, 0.2);
+    border-color: var(--primary-light);
+}
+
+.metric-card {
+    background: linear-gradient(135deg, var(--primary) 0%, var(--primary-dark) 100%);
+    border-radius: 12px;
+    padding: 1.5rem;
+    color: white;
+}
+
+.metric-card-secondary {
+    background: linear-gradient(135deg, var(--secondary) 0%, var(--secondary-dark) 100%);
+}
+
+.metric-card-accent {
+    background: linear-gradient(135deg, var(--accent) 0%, #FF4757 100%);
+}
+
+.metric-grid {
+    display: grid;
+    grid-template-columns: repeat(4, minmax(0, 1fr));
+    gap: 1rem;
+    margin-bottom: 1rem;
+}
+
+/* Typography */
+h1, h2, h3, h4, h5, h6 {
+    font-weight: 700 !important;
+    color: var(--light) !important;
+    margin-bottom: 1rem !important;
+}
+
+.subtitle {
+    color: var(--gray) !important;
+    font-weight: 500 !important;
+}
+
+/* Badges */
+.badge {
+    display: inline-block;
+    padding: 0.35rem 0.75rem;
+    border-radius: 20px;
+    font-size: 0.75rem;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+
+.badge-premium {
+    background: linear-gradient(135deg, #FFD700, #FFA500);
+    color: #000;
+}
+
+.badge-high {
+    background: linear-gradient(135deg, var(--success), #059669);
+    color: white;
+}
+
+.badge-medium {
+    background: linear-gradient(135deg, var(--warning), #D97706);
+    color: white;
+}
+
+.badge-low {
+    background: linear-gradient(135deg, var(--gray), #4B5563);
+    color: white;
+}
+
+.badge-no-website {
+    background: linear-gradient(135deg, var(--accent), #DC2626);
+    color: white;
+}
+
+.badge-broken-website {
+    background: linear-gradient(135deg, #F97316, #EA580C);
+    color: white;
+}
+
+.badge-active-website {
+    background: linear-gradient(135deg, var(--success), #059669);
+    color: white;
+}
+
+/* Buttons */
+.stButton > button {
+    border-radius: 8px !important;
+    font-weight: 600 !important;
+    transition: all 0.3s ease !important;
+    border: none !important;
+}
+
+.stButton > button:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3) !important;
+}
+
+/* Data Tables */
+.dataframe {
+    border-radius: 8px !important;
+    overflow: hidden !important;
+}
+
+.dataframe th {
+    background: linear-gradient(135deg, var(--primary), var(--primary-dark)) !important;
+    color: white !important;
+    font-weight: 600 !important;
+    border: none !important;
+}
+
+.dataframe td {
+    border-color: rgba(255, 255, 255, 0.1) !important;
+    padding: 12px !important;
+}
+
+/* Tabs */
+.stTabs [data-baseweb="tab-list"] {
+    gap: 8px;
+    background: rgba(255, 255, 255, 0.05);
+    border-radius: 12px;
+    padding: 4px;
+}
+
+.stTabs [data-baseweb="tab"] {
+    border-radius: 8px !important;
+    padding: 12px 24px !important;
+    font-weight: 600 !important;
+    transition: all 0.3s ease !important;
+}
+
+.stTabs [aria-selected="true"] {
+    background: linear-gradient(135deg, var(--primary), var(--primary-dark)) !important;
+    color: white !important;
+}
+
+/* Sidebar */
+section[data-testid="stSidebar"] {
+    background: linear-gradient(180deg, var(--dark) 0%, #0F172A 100%) !important;
+    border-right: 1px solid rgba(255, 255, 255, 0.1) !important;
+}
+
+/* Scrollbar */
+::-webkit-scrollbar {
+    width: 8px;
+    height: 8px;
+}
+
+::-webkit-scrollbar-track {
+    background: rgba(255, 255, 255, 0.05);
+    border-radius: 4px;
+}
+
+::-webkit-scrollbar-thumb {
+    background: var(--primary);
+    border-radius: 4px;
+}
+
+::-webkit-scrollbar-thumb:hover {
+    background: var(--primary-light);
+}
+
+/* Hide Streamlit elements */
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+header {visibility: hidden;}
+
+/* Animations */
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateY(10px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+
+.fade-in {
+    animation: fadeIn 0.5s ease-out;
+}
+
+/* Status Indicators */
+.status-dot {
+    display: inline-block;
+    width: 8px;
+    height: 8px;
+    border-radius: 50%;
+    margin-right: 8px;
+}
+
+.status-active { background-color: var(--success); }
+.status-paused { background-color: var(--warning); }
+.status-stopped { background-color: var(--danger); }
+
+/* Form Elements */
+.stTextInput > div > div > input,
+.stSelectbox > div > div,
+.stNumberInput > div > div > input,
+.stTextArea > div > div > textarea {
+    border-radius: 8px !important;
+    border: 1px solid rgba(255, 255, 255, 0.2) !important;
+    background: rgba(255, 255, 255, 0.05) !important;
+    color: white !important;
+}
+
+/* Loader */
+.loader {
+    border: 3px solid rgba(255, 255, 255, 0.1);
+    border-top: 3px solid var(--primary);
+    border-radius: 50%;
+    width: 40px;
+    height: 40px;
+    animation: spin 1s linear infinite;
+}
+
+@keyframes spin {
+    0% { transform: rotate(0deg); }
+    100% { transform: rotate(360deg); }
+}
+</style>
+""")
+
+# Page subtitles, rendered to HTML once at import
+SUBTITLE_TEMPLATE = "<p class='subtitle'>{}</p>"
+PAGE_SUBTITLES = {
+    page: SUBTITLE_TEMPLATE.format(text)
+    for page, text in {
+        "dashboard": "Real-time monitoring and insights",
+        "leads": "Filter, manage, and organize your leads",
+        "settings": "Configure your Ultimate LeadScraper",
+        "analytics": "Deep insights and performance metrics",
+        "export": "Export your leads in various formats",
+        "logs": "Monitor system activity and errors",
+        "automation": "Automate lead processing and follow-ups"
+    }.items()
+}
+
+# Dashboard metric card, filled once per card and emitted as a single grid
+METRIC_CARD_TEMPLATE = (
+    '<div class="metric-card{css_class}">'
+    '<h3 style="color: white; margin-bottom: 0.5rem;">{label}</h3>'
+    '<h1 style="color: white; font-size: 2.5rem;">{value}</h1>'
+    '<p style="color: rgba(255, 255, 255, 0.8); font-size: 0.875rem;">{caption}</p>'
+    '</div>'
+)
+
+# Dashboard recent leads table: display label -> lead field
+RECENT_LEADS_COLUMNS = {
+    "Business": "business_name",
+    "City": "city",
+    "Score": "lead_score",
+    "Quality": "quality_tier",
+    "Website": "website_status"
+}
+
+RECENT_LEADS_COLUMN_CONFIG = {
+    "Business": st.column_config.TextColumn("Business", width="large"),
+    "City": st.column_config.TextColumn("City"),
+    "Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100),
+    "Quality": st.column_config.TextColumn("Quality"),
+    "Website": st.column_config.TextColumn("Website")
+}
+
+LEADS_PAGE_SIZES = [25, 50, 100, 200]
+
+# Export page quick presets -> get_leads filters
+EXPORT_PRESET_FILTERS = {
+    "All Leads": {},
+    "High Intent Only": {"website_status": ["no_website", "broken", "parked"]},
+    "Premium Leads": {"quality_tier": ["Premium", "High"]},
+    "No Website": {"website_status": ["no_website"]},
+    "Active Leads": {"status": ["New Lead", "Contacted", "Follow Up"]}
+}
+
+# Autorefresh while scraping: poll quickly after new data, back off while idle
+REFRESH_INTERVAL_ACTIVE_MS = 10000
+REFRESH_INTERVAL_IDLE_MS = 60000
+
+# Leads management table: lead field -> display label
+LEADS_TABLE_COLUMNS = {
+    "id": "ID",
+    "business_name": "Business",
+    "city": "City",
+    "industry": "Industry",
+    "lead_score": "Score",
+    "quality_tier": "Quality",
+    "website_status": "Website",
+    "lead_status": "Status",
+    "created_at": "Created"
+}
+
+# Optional text fields, blanked once so cells never show None
+LEADS_TABLE_TEXT_COLUMNS = ["Business", "City", "Industry", "Quality", "Website", "Status", "Created"]
+
+LEADS_TABLE_COLUMN_CONFIG = {
+    "ID": st.column_config.NumberColumn("ID", width="small"),
+    "Business": st.column_config.TextColumn("Business", width="large"),
+    "City": st.column_config.TextColumn("City"),
+    "Industry": st.column_config.TextColumn("Industry"),
+    "Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100),
+    "Quality": st.column_config.TextColumn("Quality"),
+    "Website": st.column_config.TextColumn("Website"),
+    "Status": st.column_config.TextColumn("Status"),
+    "Created": st.column_config.TextColumn("Created")
+}
+
+# Sidebar header, status indicator and quick stats
+SIDEBAR_HEADER_HTML = """
+<div style="text-align: center; margin-bottom: 2rem; padding: 1rem;">
+    <h1 style="color: var(--primary); font-size: 2rem; margin-bottom: 0.5rem;">
+        🚀 Ultimate LeadScraper
+    </h1>
+    <p style="color: var(--gray); font-size: 0.875rem; font-weight: 500;">
+        v2.0 • High-Intent Lead Generation
+    </p>
+</div>
+"""
+
+# Scraper running flag -> (color, label, emoji)
+SCRAPER_STATUS_STYLES = {
+    True: ("#10B981", "Active", "🟢"),
+    False: ("#EF4444", "Inactive", "🔴")
+}
+
+STATUS_INDICATOR_TEMPLATE = (
+    '<div style="background: rgba(255, 255, 255, 0.05); padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">'
+    '<div style="display: flex; align-items: center; justify-content: space-between;">'
+    '<span style="color: {color}; font-weight: 600;">{emoji} {text}</span>'
+    '<span style="color: var(--gray); font-size: 0.875rem;">{time}</span>'
+    '</div></div>'
+)
+
+QUICK_STATS_TEMPLATE = (
+    '<div style="display: flex; gap: 1rem; margin-bottom: 0.5rem;">'
+    '<div style="flex: 1;"><div style="color: var(--gray); font-size: 0.875rem;">Today\'s Leads</div>'
+    '<div style="font-size: 1.75rem; font-weight: 700;">{today:,}</div></div>'
+    '<div style="flex: 1;"><div style="color: var(--gray); font-size: 0.875rem;">High Intent</div>'
+    '<div style="font-size: 1.75rem; font-weight: 700;">{high_intent:,}</div></div>'
+    '</div>'
+)
+
+# Lead detail badge classes; anything unmapped falls back to badge-low
+QUALITY_BADGE_CLASSES = {
+    "Premium": "badge-premium",
+    "High": "badge-high",
+    "Medium": "badge-medium",
+    "Low": "badge-low"
+}
+
+WEBSITE_STATUS_BADGE_CLASSES = {
+    "no_website": "badge-no-website",
+    "broken": "badge-broken-website",
+    "active": "badge-active-website"
+}
+
+# Log level -> accent color on the logs page
+LOG_LEVEL_COLORS = {
+    "INFO": "#3B82F6",
+    "WARNING": "#F59E0B",
+    "ERROR": "#EF4444",
+    "DEBUG": "#6B7280"
+}
+
+# Lead platform source label -> lead field
+LEAD_PLATFORM_FIELDS = (
+    ("Google", "google_business_url"),
+    ("Facebook", "facebook_business_url"),
+    ("Yelp", "yelp_business_url"),
+    ("BBB", "bbb_business_url")
+)
+
+# System log entry, joined into a single markdown for the logs page. The level-dependent
+# opening markup is built once per level; each entry only fills opener, message and timestamp.
+LOG_ENTRY_OPEN_TEMPLATE = (
+    '<div style="display: flex; justify-content: space-between; gap: 1rem; padding: 0.5rem; '
+    'border-left: 4px solid {color}; margin-bottom: 0.5rem;">'
+    '<div><strong>{level}</strong>: '
+)
+
+LOG_ENTRY_OPENERS = {
+    level: LOG_ENTRY_OPEN_TEMPLATE.format(color=color, level=level)
+    for level, color in LOG_LEVEL_COLORS.items()
+}
+
+LOG_ENTRY_TEMPLATE = (
+    '%s%s</div>'
+    '<div style="color: var(--gray); font-size: 0.875rem; white-space: nowrap;">%s</div>'
+    '</div>'
+)
+
+# Lead activity timeline card, joined into a single markdown per lead
+ACTIVITY_CARD_TEMPLATE = (
+    '<div style="display: flex; justify-content: space-between; gap: 1rem; padding: 0.75rem 0; '
+    'border-bottom: 1px solid rgba(128, 128, 128, 0.2);">'
+    '<div><strong>{activity_type}</strong>'
+    '<div style="color: var(--gray); font-size: 0.875rem;">{details}</div></div>'
+    '<div style="color: var(--gray); font-size: 0.875rem; white-space: nowrap;">{created_at}</div>'
+    '</div>'
+)
+
+# ============================================================================
+# DASHBOARD CHARTS
+# ============================================================================
+
+@st.cache_data(ttl=30, show_spinner=False)
+def build_quality_pie(quality_data: List[Dict]):
+    """Build the lead quality distribution pie chart"""
+    import pandas as pd
+    import plotly.express as px
+    
+    df_quality = pd.DataFrame(quality_data)
+    fig_quality = px.pie(
+        df_quality,
+        values='count',
+        names='quality_tier',
+        color='quality_tier',
+        color_discrete_map={
+            'Premium': '#FFD700',
+            'High': '#10B981',
+            'Medium': '#F59E0B',
+            'Low': '#6B7280',
+            'Unknown': '#9CA3AF'
+        },
+        hole=0.4
+    )
+    fig_quality.update_layout(
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    return fig_quality
+
+@st.cache_data(ttl=30, show_spinner=False)
+def build_website_status_bar(website_data: List[Dict]):
+    """Build the website status bar chart"""
+    import pandas as pd
+    import plotly.express as px
+    
+    df_website = pd.DataFrame(website_data)
+    
+    # Color mapping for website status
+    status_colors = {
+        'active': '#10B981',
+        'no_website': '#EF4444',
+        'broken': '#F59E0B',
+        'parked': '#8B5CF6',
+        'placeholder': '#EC4899',
+        'unknown': '#6B7280'
+    }
+    
+    fig_website = px.bar(
+        df_website,
+        x='website_status',
+        y='count',
+        color='website_status',
+        color_discrete_map=status_colors,
+        text='count'
+    )
+    fig_website.update_layout(
+        xaxis_title="Website Status",
+        yaxis_title="Count",
+        showlegend=False
+    )
+    fig_website.update_traces(texttemplate='%{text}', textposition='outside')
+    return fig_website
+
+@st.cache_data(ttl=30, show_spinner=False)
+def build_daily_trend_frame(daily_data: List[Dict]):
+    """Build the date-sorted frame for the native daily trend area chart"""
+    import pandas as pd
+    
+    df_daily = pd.DataFrame(daily_data)
+    df_daily['date'] = pd.to_datetime(df_daily['date'])
+    return df_daily.sort_values('date')[['date', 'leads_count']]
+
+@st.cache_data(ttl=30, show_spinner=False)
+def build_top_cities_bar(top_cities: List[Dict]):
+    """Build the top cities bar chart"""
+    import pandas as pd
+    import plotly.express as px
+    
+    df_cities = pd.DataFrame(top_cities)
+    df_cities = df_cities.sort_values('lead_count', ascending=False).head(10)
+    
+    fig_cities = px.bar(
+        df_cities,
+        x='city',
+        y='lead_count',
+        color='lead_count',
+        color_continuous_scale='blues',
+        text='lead_count'
+    )
+    fig_cities.update_layout(
+        xaxis_title="City",
+        yaxis_title="Lead Count",
+        showlegend=False
+    )
+    fig_cities.update_traces(texttemplate='%{text}', textposition='outside')
+    return fig_cities
+
+# ============================================================================
+# ULTIMATE STREAMLIT DASHBOARD
+# ============================================================================
+
+class UltimateStreamlitDashboard:
+    """Ultimate Streamlit dashboard with all features"""
+    
+    def __init__(self):
+        self.crm = crm
+        self.runner = get_scraper_runner()
+        self.setup_page()
+    
+    def setup_page(self):
+        """Setup Streamlit page configuration"""
+        st.set_page_config(
+            page_title="Ultimate LeadScraper CRM",
+            page_icon="🚀",
+            layout="wide",
+            initial_sidebar_state="expanded",
+            menu_items={
+                'Get Help': 'https://github.com/yourusername/ultimate-lead-scraper',
+                'Report a bug': 'https://github.com/yourusername/ultimate-lead-scraper/issues',
+                'About': '# Ultimate LeadScraper CRM v2.0\nHigh-Intent Lead Generation System'
+            }
+        )
+        
+        # Apply custom CSS
+        self.setup_custom_css()
+        
+        # Initialize session state
+        if 'initialized' not in st.session_state:
+            st.session_state.update({
+                "initialized": True,
+                "current_mode": CONFIG.active_mode,
+                "lead_filters": {},
+                "selected_lead_id": None,
+                "export_data": None
+            })
+            
+            # The dashboard object is rebuilt on every rerun; log once per session
+            logger.log("✅ Ultimate Streamlit Dashboard initialized", "SUCCESS")
+    
+    def setup_custom_css(self):
+        """Setup custom CSS with modern design"""
+        st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
     
     def start_scraper(self):
-        """Start the scraper"""
-        if not self.scraper_running:
-            self.scraper_running = True
-            st.session_state.scraper_running = True
-            
-            # Start background thread
-            self.scraper_thread = threading.Thread(target=self.run_scraper_background, daemon=True)
-            self.scraper_thread.start()
-            
-            return True
-        return False
+        """Start the scraper, recording the outcome for the sidebar message"""
+        cached_sidebar_counts.clear()
+        started = self.runner.start()
+        st.session_state.scraper_action = "started" if started else None
+        return started
     
     def stop_scraper(self):
-        """Stop the scraper"""
-        self.scraper_running = False
-        if self.scraper:
-            self.scraper.stop()
-        
-        st.session_state.scraper_running = False
-        return True
+        """Stop the scraper, recording the outcome for the sidebar message"""
+        cached_sidebar_counts.clear()
+        stopped = self.runner.stop()
+        st.session_state.scraper_action = "stopped" if stopped else None
+        return stopped
     
     def render_sidebar(self):
         """Render the modern sidebar"""
         with st.sidebar:
             # Logo and Title
-            st.markdown("""
-            <div style="text-align: center; margin-bottom: 2rem; padding: 1rem;">
-                <h1 style="color: var(--primary); font-size: 2rem; margin-bottom: 0.5rem;">
-                    🚀 Ultimate LeadScraper
-                </h1>
-                <p style="color: var(--gray); font-size: 0.875rem; font-weight: 500;">
-                    v2.0 • High-Intent Lead Generation
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            render_html(SIDEBAR_HEADER_HTML)
             
             # Navigation
             st.markdown("### 📱 Navigation")
             
-            nav_options = {
-                "📊 Dashboard": "dashboard",
-                "👥 Leads Management": "leads",
-                "🔍 Lead Details": "lead_details",
-                "⚙️ Settings": "settings",
-                "📈 Analytics": "analytics",
-                "📤 Export": "export",
-                "📋 Logs": "logs",
-                "🔄 Automation": "automation"
-            }
-            
             selected_nav = st.radio(
                 "Go to",
-                list(nav_options.keys()),
+                NAV_LABELS,
                 label_visibility="collapsed",
                 key="nav_selection"
             )
@@ -3177,303 +4312,219 @@ class UltimateStreamlitDashboard:
                 mode_key = mode_options[selected_mode]
                 if mode_key != st.session_state.current_mode:
                     st.session_state.current_mode = mode_key
-                    if self.scraper:
-                        self.scraper.set_mode(mode_key)
+                    self.runner.set_mode(mode_key)
             
             # Control Buttons
+            scraper_running = self.runner.is_running()
             col1, col2, col3 = st.columns(3)
             
+            # Outcome recorded by the Start/Stop callback during this rerun
+            scraper_action = st.session_state.pop("scraper_action", None)
+            
             with col1:
-                start_disabled = st.session_state.get('scraper_running', False)
-                if st.button("▶️ Start", disabled=start_disabled, use_container_width=True, type="primary"):
-                    if self.start_scraper():
+                # A stopping thread still finishes its cycle, so Start stays disabled until it exits
+                start_disabled = scraper_running or self.runner.is_alive()
+                # Callbacks run before the rerun, so the buttons and status
+                # already reflect the new state without a second st.rerun()
+                if st.button("▶️ Start", disabled=start_disabled, use_container_width=True,
+                             type="primary", on_click=self.start_scraper):
+                    if scraper_action == "started":
                         st.success("Scraper started!")
-                        st.rerun()
             
             with col2:
-                stop_disabled = not st.session_state.get('scraper_running', False)
-                if st.button("⏹️ Stop", disabled=stop_disabled, use_container_width=True, type="secondary"):
-                    if self.stop_scraper():
+                stop_disabled = not scraper_running
+                if st.button("⏹️ Stop", disabled=stop_disabled, use_container_width=True,
+                             type="secondary", on_click=self.stop_scraper):
+                    if scraper_action == "stopped":
                         st.info("Scraper stopped!")
-                        st.rerun()
             
             with col3:
                 if st.button("⏸️ Pause", use_container_width=True):
-                    if self.scraper:
-                        self.scraper.pause()
+                    if self.runner.pause():
                         st.info("Scraper paused!")
             
-            # Status Indicator
-            st.markdown("---")
-            st.markdown("### 📊 Status")
-            
-            if st.session_state.get('scraper_running'):
-                status_color = "#10B981"
-                status_text = "Active"
-                status_emoji = "🟢"
-            else:
-                status_color = "#EF4444"
-                status_text = "Inactive"
-                status_emoji = "🔴"
-            
-            st.markdown(f"""
-            <div style="background: rgba(255, 255, 255, 0.05); padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
-                <div style="display: flex; align-items: center; justify-content: space-between;">
-                    <span style="color: {status_color}; font-weight: 600;">{status_emoji} {status_text}</span>
-                    <span style="color: var(--gray); font-size: 0.875rem;">{datetime.now().strftime('%H:%M:%S')}</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Quick Stats
-            st.markdown("### 📈 Quick Stats")
-            
-            today_stats = self.crm.get_today_stats()
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.metric("Today's Leads", today_stats.get('today_leads', 0))
-            
-            with col2:
-                st.metric("High Intent", today_stats.get('high_intent_leads', 0))
-            
-            # System Info
-            st.markdown("---")
-            st.markdown("### 💻 System Info")
-            
-            info_items = [
-                ("Database", "✅ Connected" if self.crm.conn else "❌ Error"),
-                ("AI Enrichment", "✅ Active" if OPENAI_AVAILABLE and CONFIG.api.openai_api_key else "❌ Disabled"),
-                ("Mode", CONFIG.scraper_modes[st.session_state.current_mode].name),
-                ("Cities", len(CONFIG.cities)),
-                ("Industries", len(CONFIG.industries))
-            ]
-            
-            for label, value in info_items:
-                st.markdown(f"**{label}:** {value}")
+            # Status, quick stats and system info refresh on their own without rerunning the page
+            self.render_sidebar_status()
+        
+        return NAV_OPTIONS[selected_nav]
+    
+    def get_system_info_rows(self) -> Tuple[str, str]:
+        """Get the config-derived System Info rows, built once per session"""
+        if 'system_info_rows' not in st.session_state:
+            ai_status = "✅ Active" if AI_ENRICHMENT_ACTIVE else "❌ Disabled"
+            st.session_state.system_info_rows = (
+                f"**AI Enrichment:** {ai_status}",
+                f"**Cities:** {len(CONFIG.cities)}  \n**Industries:** {len(CONFIG.industries)}"
+            )
+        return st.session_state.system_info_rows
+    
+    @st_fragment(run_every=2)
+    def render_sidebar_status(self):
+        """Render the status, quick stats and system info as one markdown block"""
+        # Status Indicator
+        status_color, status_text, status_emoji = SCRAPER_STATUS_STYLES[self.runner.is_running()]
+        sections = [
+            "---\n### 📊 Status",
+            STATUS_INDICATOR_TEMPLATE.format(
+                color=status_color,
+                emoji=status_emoji,
+                text=status_text,
+                time=datetime.now().strftime("%H:%M:%S")
+            )
+        ]
         
-        return nav_options[selected_nav]
+        runner_stats = self.runner.snapshot_stats()
+        if runner_stats:
+            sections.append(f"Cycles: {runner_stats.get('cycles_completed', 0)} • "
+                            f"Leads found: {runner_stats['stats'].get('total_leads_found', 0)}")
+        
+        # Quick Stats
+        today_stats, total_leads = cached_sidebar_counts(get_db_version())
+        sections.append("### 📈 Quick Stats")
+        sections.append(QUICK_STATS_TEMPLATE.format(
+            today=today_stats.get("today_leads") or 0,
+            high_intent=today_stats.get("high_intent_leads") or 0
+        ))
+        sections.append(f"Total leads: {total_leads:,}")
+        
+        # System Info
+        ai_row, location_rows = self.get_system_info_rows()
+        sections.append("---\n### 💻 System Info")
+        sections.append("  \n".join([
+            f"**Database:** {'✅ Connected' if self.crm.conn else '❌ Error'}",
+            ai_row,
+            f"**Mode:** {CONFIG.scraper_modes[st.session_state.current_mode].name}",
+            location_rows
+        ]))
+        
+        st.markdown("\n\n".join(sections), unsafe_allow_html=True)
     
     def render_dashboard(self):
         """Render the main dashboard"""
-        st.title("📊 Ultimate Dashboard")
-        st.markdown("<p class='subtitle'>Real-time monitoring and insights</p>", unsafe_allow_html=True)
+        title_col, refresh_col = st.columns([5, 1])
+        with title_col:
+            st.title("📊 Ultimate Dashboard")
+        with refresh_col:
+            if st.button("🔄 Refresh", use_container_width=True, key="dashboard_refresh_button"):
+                clear_dashboard_cache()
+                st.session_state.pop('dashboard_render', None)
+        render_html(PAGE_SUBTITLES["dashboard"])
+        
+        # Reuse this session's stats and figures while the database is unchanged
+        db_version = get_db_version()
+        render_key = ("7d", db_version)
+        dashboard_render = st.session_state.get('dashboard_render')
+        if dashboard_render is None or dashboard_render['key'] != render_key:
+            dashboard_render = {'key': render_key, 'stats': cached_statistics(*render_key), 'figures': {}}
+            st.session_state.dashboard_render = dashboard_render
+        stats = dashboard_render['stats']
         
         # Top Metrics Row
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            stats = self.crm.get_statistics("7d")
-            total_leads = stats.get('overall', {}).get('total_leads', 0)
-            st.markdown("""
-            <div class="metric-card">
-                <h3 style="color: white; margin-bottom: 0.5rem;">Total Leads</h3>
-                <h1 style="color: white; font-size: 2.5rem;">{:,}</h1>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.875rem;">Last 7 days</p>
-            </div>
-            """.format(total_leads), unsafe_allow_html=True)
-        
-        with col2:
-            total_value = stats.get('overall', {}).get('total_potential_value', 0)
-            st.markdown("""
-            <div class="metric-card metric-card-secondary">
-                <h3 style="color: white; margin-bottom: 0.5rem;">Potential Value</h3>
-                <h1 style="color: white; font-size: 2.5rem;">${:,}</h1>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.875rem;">Estimated</p>
-            </div>
-            """.format(total_value), unsafe_allow_html=True)
-        
-        with col3:
-            avg_score = stats.get('overall', {}).get('average_score', 0)
-            st.markdown("""
-            <div class="metric-card">
-                <h3 style="color: white; margin-bottom: 0.5rem;">Avg. Score</h3>
-                <h1 style="color: white; font-size: 2.5rem;">{:.1f}</h1>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.875rem;">Lead Quality</p>
-            </div>
-            """.format(avg_score), unsafe_allow_html=True)
-        
-        with col4:
-            premium_leads = sum(1 for q in stats.get('quality_distribution', []) 
-                              if q.get('quality_tier') in ['Premium', 'High'])
-            st.markdown("""
-            <div class="metric-card metric-card-accent">
-                <h3 style="color: white; margin-bottom: 0.5rem;">Premium Leads</h3>
-                <h1 style="color: white; font-size: 2.5rem;">{:,}</h1>
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.875rem;">High Quality</p>
-            </div>
-            """.format(premium_leads), unsafe_allow_html=True)
+        overall = stats.get('overall', {})
+        premium_leads = sum(q.get('count', 0) for q in stats.get('quality_distribution', [])
+                            if q.get('quality_tier') in ['Premium', 'High'])
+        metric_cards = (
+            ("", "Total Leads", f"{overall.get('total_leads') or 0:,}", "Last 7 days"),
+            (" metric-card-secondary", "Potential Value", f"${overall.get('total_potential_value') or 0:,}", "Estimated"),
+            ("", "Avg. Score", f"{overall.get('average_score') or 0:.1f}", "Lead Quality"),
+            (" metric-card-accent", "Premium Leads", f"{premium_leads:,}", "High Quality")
+        )
+        render_html(
+            "<div class='metric-grid'>" + "".join(
+                METRIC_CARD_TEMPLATE.format(css_class=css_class, label=label, value=value, caption=caption)
+                for css_class, label, value, caption in metric_cards
+            ) + "</div>"
+        )
         
         # Charts Row
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("<div class='modern-card'>", unsafe_allow_html=True)
-            st.subheader("📊 Lead Quality Distribution")
-            
-            quality_data = stats.get('quality_distribution', [])
-            if quality_data:
-                df_quality = pd.DataFrame(quality_data)
-                fig_quality = px.pie(
-                    df_quality,
-                    values='count',
-                    names='quality_tier',
-                    color='quality_tier',
-                    color_discrete_map={
-                        'Premium': '#FFD700',
-                        'High': '#10B981',
-                        'Medium': '#F59E0B',
-                        'Low': '#6B7280',
-                        'Unknown': '#9CA3AF'
-                    },
-                    hole=0.4
-                )
-                fig_quality.update_layout(
-                    showlegend=True,
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="right",
-                        x=1
-                    )
-                )
-                st.plotly_chart(fig_quality, use_container_width=True)
-            else:
-                st.info("No quality data available yet.")
-            st.markdown("</div>", unsafe_allow_html=True)
+            with st.container(border=True):
+                st.subheader("📊 Lead Quality Distribution")
+                
+                quality_data = stats.get('quality_distribution', [])
+                if quality_data:
+                    st.plotly_chart(self.get_dashboard_figure('quality', build_quality_pie, quality_data), use_container_width=True)
+                else:
+                    st.info("No quality data available yet.")
         
         with col2:
-            st.markdown("<div class='modern-card'>", unsafe_allow_html=True)
-            st.subheader("🌐 Website Status Analysis")
-            
-            website_data = stats.get('website_status_distribution', [])
-            if website_data:
-                df_website = pd.DataFrame(website_data)
-                
-                # Color mapping for website status
-                status_colors = {
-                    'active': '#10B981',
-                    'no_website': '#EF4444',
-                    'broken': '#F59E0B',
-                    'parked': '#8B5CF6',
-                    'placeholder': '#EC4899',
-                    'unknown': '#6B7280'
-                }
+            with st.container(border=True):
+                st.subheader("🌐 Website Status Analysis")
                 
-                fig_website = px.bar(
-                    df_website,
-                    x='website_status',
-                    y='count',
-                    color='website_status',
-                    color_discrete_map=status_colors,
-                    text='count'
-                )
-                fig_website.update_layout(
-                    xaxis_title="Website Status",
-                    yaxis_title="Count",
-                    showlegend=False
-                )
-                fig_website.update_traces(texttemplate='%{text}', textposition='outside')
-                st.plotly_chart(fig_website, use_container_width=True)
-            else:
-                st.info("No website status data available yet.")
-            st.markdown("</div>", unsafe_allow_html=True)
+                website_data = stats.get('website_status_distribution', [])
+                if website_data:
+                    st.plotly_chart(self.get_dashboard_figure('website', build_website_status_bar, website_data), use_container_width=True)
+                else:
+                    st.info("No website status data available yet.")
         
         # Daily Trend Chart
-        st.markdown("<div class='modern-card'>", unsafe_allow_html=True)
-        st.subheader("📈 Daily Lead Acquisition Trend")
-        
-        daily_data = stats.get('daily_trend', [])
-        if daily_data:
-            df_daily = pd.DataFrame(daily_data)
-            df_daily['date'] = pd.to_datetime(df_daily['date'])
-            df_daily = df_daily.sort_values('date')
-            
-            fig_daily = px.area(
-                df_daily,
-                x='date',
-                y='leads_count',
-                title='',
-                markers=True,
-                color_discrete_sequence=['#0066FF']
-            )
-            fig_daily.update_layout(
-                xaxis_title="Date",
-                yaxis_title="Leads Count",
-                hovermode='x unified'
-            )
-            st.plotly_chart(fig_daily, use_container_width=True)
-        else:
-            st.info("No daily trend data available yet.")
-        st.markdown("</div>", unsafe_allow_html=True)
+        with st.container(border=True):
+            st.subheader("📈 Daily Lead Acquisition Trend")
+            
+            daily_data = stats.get('daily_trend', [])
+            if daily_data:
+                # Native Vega-Lite chart; no Plotly figure to build or serialize
+                st.area_chart(
+                    self.get_dashboard_figure('daily', build_daily_trend_frame, daily_data),
+                    x='date',
+                    y='leads_count',
+                    color='#0066FF',
+                    use_container_width=True
+                )
+            else:
+                st.info("No daily trend data available yet.")
         
         # Recent Leads and Top Lists
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("<div class='modern-card'>", unsafe_allow_html=True)
-            st.subheader("🆕 Recent Leads")
-            
-            recent_leads = self.crm.get_leads(page=1, per_page=10)
-            if recent_leads["leads"]:
-                df_recent = pd.DataFrame(recent_leads["leads"])
+            with st.container(border=True):
+                st.subheader("🆕 Recent Leads")
                 
-                if not df_recent.empty:
-                    display_cols = ['business_name', 'city', 'lead_score', 'quality_tier', 'website_status']
-                    if all(col in df_recent.columns for col in display_cols):
-                        df_display = df_recent[display_cols].copy()
-                        df_display.columns = ['Business', 'City', 'Score', 'Quality', 'Website']
-                        
-                        # Format the display
-                        st.dataframe(
-                            df_display,
-                            use_container_width=True,
-                            hide_index=True,
-                            column_config={
-                                "Business": st.column_config.TextColumn("Business", width="large"),
-                                "City": st.column_config.TextColumn("City"),
-                                "Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100),
-                                "Quality": st.column_config.TextColumn("Quality"),
-                                "Website": st.column_config.TextColumn("Website")
-                            }
-                        )
-            else:
-                st.info("No recent leads found.")
-            st.markdown("</div>", unsafe_allow_html=True)
+                recent_leads = cached_recent_leads(10, db_version)
+                if recent_leads["leads"]:
+                    # Column-oriented dict straight from the rows; no DataFrame needed for 10 leads
+                    leads = recent_leads["leads"]
+                    recent_display = {
+                        label: [lead.get(field) for lead in leads]
+                        for label, field in RECENT_LEADS_COLUMNS.items()
+                    }
+                
+                    # Format the display
+                    st.dataframe(
+                        recent_display,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config=RECENT_LEADS_COLUMN_CONFIG
+                    )
+                else:
+                    st.info("No recent leads found.")
         
         with col2:
-            st.markdown("<div class='modern-card'>", unsafe_allow_html=True)
-            st.subheader("🏆 Top Cities")
-            
-            top_cities = stats.get('top_cities', [])
-            if top_cities:
-                df_cities = pd.DataFrame(top_cities)
-                df_cities = df_cities.sort_values('lead_count', ascending=False).head(10)
+            with st.container(border=True):
+                st.subheader("🏆 Top Cities")
                 
-                fig_cities = px.bar(
-                    df_cities,
-                    x='city',
-                    y='lead_count',
-                    color='lead_count',
-                    color_continuous_scale='blues',
-                    text='lead_count'
-                )
-                fig_cities.update_layout(
-                    xaxis_title="City",
-                    yaxis_title="Lead Count",
-                    showlegend=False
-                )
-                fig_cities.update_traces(texttemplate='%{text}', textposition='outside')
-                st.plotly_chart(fig_cities, use_container_width=True)
-            else:
-                st.info("No city data available yet.")
-            st.markdown("</div>", unsafe_allow_html=True)
+                top_cities = stats.get('top_cities', [])
+                if top_cities:
+                    st.plotly_chart(self.get_dashboard_figure('cities', build_top_cities_bar, top_cities), use_container_width=True)
+                else:
+                    st.info("No city data available yet.")
+    
+    def get_dashboard_figure(self, name: str, builder, data: List[Dict]):
+        """Get a dashboard figure, reusing the one built for the current stats"""
+        figures = st.session_state.dashboard_render['figures']
+        if name not in figures:
+            figures[name] = builder(data)
+        return figures[name]
     
     def render_leads_management(self):
         """Render leads management page"""
+        import pandas as pd
+        
         st.title("👥 Leads Management")
-        st.markdown("<p class='subtitle'>Filter, manage, and organize your leads</p>", unsafe_allow_html=True)
+        render_html(PAGE_SUBTITLES["leads"])
         
         # Advanced Filters
         with st.expander("🔍 Advanced Filters", expanded=False):
@@ -3554,67 +4605,67 @@ class UltimateStreamlitDashboard:
         if date_to:
             filters["date_to"] = date_to.isoformat()
         
-        # Get leads with filters
-        leads_data = self.crm.get_leads(filters=filters, page=1, per_page=100)
+        # Get the current page of leads; a filter change starts over at page 1
+        filters_key = make_filters_key(filters)
+        if st.session_state.get('leads_filters_key') != filters_key:
+            st.session_state.leads_filters_key = filters_key
+            st.session_state.leads_page = 1
+        page_size = st.session_state.get('leads_page_size', LEADS_PAGE_SIZES[1])
+        
+        db_version = get_db_version()
+        
+        # Aggregate metrics run in the background while the page of leads is fetched
+        summary_future = submit_background(cached_leads_summary, filters_key, db_version)
+        leads_data = cached_get_leads(filters_key, st.session_state.leads_page, page_size, db_version,
+                                      columns=tuple(LEADS_TABLE_COLUMNS))
+        
+        # Clamp to the last page if leads were removed since the page was chosen
+        if not leads_data["leads"] and st.session_state.leads_page > leads_data.get("total_pages", 0) > 0:
+            st.session_state.leads_page = leads_data.get("total_pages")
+            leads_data = cached_get_leads(filters_key, st.session_state.leads_page, page_size, db_version,
+                                          columns=tuple(LEADS_TABLE_COLUMNS))
+        
         leads = leads_data["leads"]
-        total_leads = leads_data["total"]
         
-        # Display metrics
+        # Display metrics, aggregated in SQL over every matching lead rather than the current page
+        summary = summary_future.result()
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Leads", total_leads)
+            st.metric("Total Leads", summary["total"])
         
         with col2:
-            high_intent = sum(1 for lead in leads if lead.get('website_status') in ['no_website', 'broken', 'parked'])
-            st.metric("High Intent", high_intent)
+            st.metric("High Intent", summary["high_intent"])
         
         with col3:
-            premium = sum(1 for lead in leads if lead.get('quality_tier') in ['Premium', 'High'])
-            st.metric("Premium", premium)
+            st.metric("Premium", summary["premium"])
         
         with col4:
-            avg_score = sum(lead.get('lead_score', 0) for lead in leads) / len(leads) if leads else 0
-            st.metric("Avg Score", f"{avg_score:.1f}")
+            st.metric("Avg Score", f"{summary['avg_score']:.1f}")
         
         if leads:
-            # Create dataframe for display
-            df = pd.DataFrame(leads)
-            
             # Select columns for display
-            display_columns = [
-                'id', 'business_name', 'city', 'industry', 'lead_score',
-                'quality_tier', 'website_status', 'lead_status', 'created_at'
-            ]
+            display_columns = list(LEADS_TABLE_COLUMNS)
             
-            if all(col in df.columns for col in display_columns):
-                df_display = df[display_columns].copy()
-                df_display.columns = [
-                    'ID', 'Business', 'City', 'Industry', 'Score',
-                    'Quality', 'Website', 'Status', 'Created'
-                ]
+            if set(display_columns).issubset(leads[0]):
+                # Build the dataframe from the displayed fields only
+                df_display = pd.DataFrame.from_records(leads, columns=display_columns)
+                df_display.columns = list(LEADS_TABLE_COLUMNS.values())
+                df_display[LEADS_TABLE_TEXT_COLUMNS] = df_display[LEADS_TABLE_TEXT_COLUMNS].fillna('')
                 
-                # Format dates
-                df_display['Created'] = pd.to_datetime(df_display['Created']).dt.strftime('%Y-%m-%d')
+                # Format dates: timestamps are stored as ISO strings, so the date is the first 10 chars
+                df_display['Created'] = df_display['Created'].str.slice(0, 10)
                 
                 # Display with interactive features
                 st.dataframe(
                     df_display,
                     use_container_width=True,
                     hide_index=True,
-                    column_config={
-                        "ID": st.column_config.NumberColumn("ID", width="small"),
-                        "Business": st.column_config.TextColumn("Business", width="large"),
-                        "City": st.column_config.TextColumn("City"),
-                        "Industry": st.column_config.TextColumn("Industry"),
-                        "Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100),
-                        "Quality": st.column_config.TextColumn("Quality"),
-                        "Website": st.column_config.TextColumn("Website"),
-                        "Status": st.column_config.TextColumn("Status"),
-                        "Created": st.column_config.TextColumn("Created")
-                    }
+                    column_config=LEADS_TABLE_COLUMN_CONFIG
                 )
                 
+                self.render_leads_pagination(leads_data)
+                
                 # Lead selection for detailed view
                 st.subheader("📋 Lead Details")
                 
@@ -3625,7 +4676,7 @@ class UltimateStreamlitDashboard:
                 )
                 
                 if selected_id:
-                    lead_details = self.crm.get_lead_by_id(selected_id)
+                    lead_details = cached_lead_by_id(selected_id, db_version)
                     if lead_details:
                         self.render_lead_detail_view(lead_details)
             else:
@@ -3633,6 +4684,35 @@ class UltimateStreamlitDashboard:
         else:
             st.info("No leads match the current filters.")
     
+    def render_leads_pagination(self, leads_data: Dict):
+        """Render prev/next controls and the page size selector for the leads table"""
+        page = leads_data["page"]
+        total_pages = max(leads_data.get("total_pages", 0), 1)
+        
+        col1, col2, col3, col4 = st.columns([1, 2, 1, 1])
+        
+        with col1:
+            st.button("◀ Prev", disabled=page <= 1, use_container_width=True,
+                      key="leads_prev", on_click=self.change_leads_page, args=(-1,))
+        
+        with col2:
+            st.caption(f"Page {page} of {total_pages} • {leads_data['total']:,} leads")
+        
+        with col3:
+            st.selectbox("Rows per page", LEADS_PAGE_SIZES, index=1, key="leads_page_size",
+                         label_visibility="collapsed", on_change=self.change_leads_page, args=(0,))
+        
+        with col4:
+            st.button("Next ▶", disabled=page >= total_pages, use_container_width=True,
+                      key="leads_next", on_click=self.change_leads_page, args=(1,))
+    
+    def change_leads_page(self, step: int):
+        """Move the leads table by step pages; a step of 0 returns to the first page"""
+        if step:
+            st.session_state.leads_page = max(1, st.session_state.get('leads_page', 1) + step)
+        else:
+            st.session_state.leads_page = 1
+    
     def render_lead_detail_view(self, lead: Dict):
         """Render detailed lead view"""
         with st.container():
@@ -3641,31 +4721,20 @@ class UltimateStreamlitDashboard:
             with col1:
                 st.markdown(f"### {lead.get('business_name', 'Unknown Business')}")
                 
-                # Badges row
-                col_b1, col_b2, col_b3, col_b4 = st.columns(4)
+                # Badges row, emitted as a single HTML block
+                col_badges, col_score = st.columns([3, 1])
                 
-                with col_b1:
+                with col_badges:
                     quality = lead.get('quality_tier', 'Unknown')
-                    badge_class = f"badge-{quality.lower()}" if quality != 'Unknown' else "badge-low"
-                    st.markdown(f'<span class="badge {badge_class}">{quality}</span>', unsafe_allow_html=True)
-                
-                with col_b2:
                     website_status = lead.get('website_status', 'unknown')
-                    if website_status == 'no_website':
-                        badge_class = "badge-no-website"
-                    elif website_status == 'broken':
-                        badge_class = "badge-broken-website"
-                    elif website_status == 'active':
-                        badge_class = "badge-active-website"
-                    else:
-                        badge_class = "badge-low"
-                    st.markdown(f'<span class="badge {badge_class}">{website_status}</span>', unsafe_allow_html=True)
-                
-                with col_b3:
                     status = lead.get('lead_status', 'New Lead')
-                    st.markdown(f'<span class="badge badge-medium">{status}</span>', unsafe_allow_html=True)
+                    render_html(
+                        f'<span class="badge {QUALITY_BADGE_CLASSES.get(quality, "badge-low")}">{quality}</span> '
+                        f'<span class="badge {WEBSITE_STATUS_BADGE_CLASSES.get(website_status, "badge-low")}">{website_status}</span> '
+                        f'<span class="badge badge-medium">{status}</span>'
+                    )
                 
-                with col_b4:
+                with col_score:
                     score = lead.get('lead_score', 0)
                     st.progress(score / 100, text=f"Score: {score}")
             
@@ -3703,17 +4772,17 @@ class UltimateStreamlitDashboard:
             st.text_input("Industry", lead.get('industry', ''), disabled=True)
             st.text_input("Business Type", lead.get('business_type', 'Unknown'), disabled=True)
             
-            if lead.get('description'):
+            description = lead.get('description')
+            if description:
                 st.markdown("##### Description")
-                st.text_area("Description", lead.get('description', ''), height=150, disabled=True)
+                st.text_area("Description", description, height=150, disabled=True)
         
         with col2:
             st.markdown("##### Services Offered")
             
             services = lead.get('services', [])
             if isinstance(services, list) and services:
-                for service in services:
-                    st.markdown(f"- {service}")
+                st.markdown("\n".join(f"- {service}" for service in services))
             else:
                 st.info("No services listed")
             
@@ -3721,8 +4790,9 @@ class UltimateStreamlitDashboard:
             
             social_media = lead.get('social_media', {})
             if isinstance(social_media, dict) and social_media:
-                for platform, url in social_media.items():
-                    st.markdown(f"**{platform.title()}:** [{url}]({url})")
+                st.markdown("\n\n".join(
+                    f"**{platform.title()}:** [{url}]({url})" for platform, url in social_media.items()
+                ))
             else:
                 st.info("No social media links")
     
@@ -3733,18 +4803,23 @@ class UltimateStreamlitDashboard:
         with col1:
             st.markdown("##### Contact Details")
             
+            contact_lines = []
+            
             website = lead.get('website', '')
             if website:
-                st.markdown(f"**Website:** [{website}]({website})")
-                st.markdown(f"**Status:** {lead.get('website_status', 'unknown').title()}")
+                contact_lines.append(f"**Website:** [{website}]({website})")
+                contact_lines.append(f"**Status:** {lead.get('website_status', 'unknown').title()}")
             
             phone = lead.get('phone', '')
             if phone:
-                st.markdown(f"**Phone:** {phone}")
+                contact_lines.append(f"**Phone:** {phone}")
             
             email = lead.get('email', '')
             if email:
-                st.markdown(f"**Email:** {email}")
+                contact_lines.append(f"**Email:** {email}")
+            
+            if contact_lines:
+                st.markdown("\n\n".join(contact_lines))
             
             address = lead.get('address', '')
             if address:
@@ -3760,18 +4835,13 @@ class UltimateStreamlitDashboard:
             st.markdown("##### Platform Sources")
             
             platforms = []
-            if lead.get('google_business_url'):
-                platforms.append(("Google", lead['google_business_url']))
-            if lead.get('facebook_business_url'):
-                platforms.append(("Facebook", lead['facebook_business_url']))
-            if lead.get('yelp_business_url'):
-                platforms.append(("Yelp", lead['yelp_business_url']))
-            if lead.get('bbb_business_url'):
-                platforms.append(("BBB", lead['bbb_business_url']))
+            for platform, field in LEAD_PLATFORM_FIELDS:
+                url = lead.get(field)
+                if url:
+                    platforms.append((platform, url))
             
             if platforms:
-                for platform, url in platforms:
-                    st.markdown(f"**{platform}:** [{url}]({url})")
+                st.markdown("\n\n".join(f"**{platform}:** [{url}]({url})" for platform, url in platforms))
             else:
                 st.info("No platform sources")
     
@@ -3853,21 +4923,15 @@ class UltimateStreamlitDashboard:
         activities = lead.get('activities', [])
         
         if activities:
-            for activity in activities[:10]:  # Show last 10 activities
-                with st.container():
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        st.markdown(f"**{activity.get('activity_type', 'Activity')}**")
-                        if activity.get('activity_details'):
-                            st.caption(activity.get('activity_details'))
-                    
-                    with col2:
-                        created_at = activity.get('created_at', '')
-                        if created_at:
-                            st.caption(created_at[:19])
-                    
-                    st.divider()
+            timeline_html = "".join(
+                ACTIVITY_CARD_TEMPLATE.format(
+                    activity_type=html.escape(activity.get('activity_type') or 'Activity'),
+                    details=html.escape(activity.get('activity_details') or ''),
+                    created_at=html.escape((activity.get('created_at') or '')[:19])
+                )
+                for activity in activities[:10]  # Show last 10 activities
+            )
+            render_html(timeline_html)
         else:
             st.info("No activities recorded yet")
         
@@ -3890,7 +4954,7 @@ class UltimateStreamlitDashboard:
     def render_settings(self):
         """Render settings page"""
         st.title("⚙️ Settings")
-        st.markdown("<p class='subtitle'>Configure your Ultimate LeadScraper</p>", unsafe_allow_html=True)
+        render_html(PAGE_SUBTITLES["settings"])
         
         # Create tabs for different setting categories
         tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
@@ -3960,6 +5024,8 @@ class UltimateStreamlitDashboard:
                 CONFIG.api.brightdata_api_key = brightdata_key or None
                 
                 save_config(CONFIG)
+                refresh_ai_enrichment_status()
+                st.session_state.pop('system_info_rows', None)
                 st.success("API keys saved successfully!")
     
     def render_scraper_mode_settings(self):
@@ -4095,6 +5161,7 @@ class UltimateStreamlitDashboard:
                 CONFIG.filters.target_cities = []
             
             save_config(CONFIG)
+            st.session_state.pop('system_info_rows', None)
             st.success("Location settings saved successfully!")
     
     def render_industry_settings(self):
@@ -4145,6 +5212,7 @@ class UltimateStreamlitDashboard:
                 CONFIG.search_phrases = [phrase.strip() for phrase in search_phrases.split("\n") if phrase.strip()]
             
             save_config(CONFIG)
+            st.session_state.pop('system_info_rows', None)
             st.success("Industry settings saved successfully!")
     
     def render_performance_settings(self):
@@ -4361,8 +5429,12 @@ class UltimateStreamlitDashboard:
     
     def render_analytics(self):
         """Render analytics page"""
+        import pandas as pd
+        import plotly.express as px
+        import plotly.graph_objects as go
+        
         st.title("📈 Advanced Analytics")
-        st.markdown("<p class='subtitle'>Deep insights and performance metrics</p>", unsafe_allow_html=True)
+        render_html(PAGE_SUBTITLES["analytics"])
         
         # Time period selector
         col1, col2, col3 = st.columns(3)
@@ -4378,82 +5450,128 @@ class UltimateStreamlitDashboard:
         stats = self.crm.get_statistics(period)
         
         # Conversion Funnel
-        st.markdown("<div class='modern-card'>", unsafe_allow_html=True)
-        st.subheader("🔄 Conversion Funnel")
-        
-        funnel_data = stats.get('conversion_funnel', [])
-        if funnel_data:
-            df_funnel = pd.DataFrame(funnel_data)
-            
-            fig_funnel = go.Figure(go.Funnel(
-                y=df_funnel['stage'],
-                x=df_funnel['count'],
-                textinfo="value+percent initial",
-                opacity=0.8,
-                marker=dict(color='#0066FF')
-            ))
-            
-            fig_funnel.update_layout(
-                height=400,
-                showlegend=False
-            )
+        with st.container(border=True):
+            st.subheader("🔄 Conversion Funnel")
             
-            st.plotly_chart(fig_funnel, use_container_width=True)
-        else:
-            st.info("No conversion data available yet.")
-        st.markdown("</div>", unsafe_allow_html=True)
+            funnel_data = stats.get('conversion_funnel', [])
+            if funnel_data:
+                df_funnel = pd.DataFrame(funnel_data)
+                
+                fig_funnel = go.Figure(go.Funnel(
+                    y=df_funnel['stage'],
+                    x=df_funnel['count'],
+                    textinfo="value+percent initial",
+                    opacity=0.8,
+                    marker=dict(color='#0066FF')
+                ))
+                
+                fig_funnel.update_layout(
+                    height=400,
+                    showlegend=False
+                )
+                
+                st.plotly_chart(fig_funnel, use_container_width=True)
+            else:
+                st.info("No conversion data available yet.")
         
         # Performance Metrics
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("<div class='modern-card'>", unsafe_allow_html=True)
-            st.subheader("📊 Performance Metrics")
-            
-            metrics_data = {
-                "Metric": ["Total Leads", "Avg. Score", "Conversion Rate", "Response Rate"],
-                "Value": [
-                    stats.get('overall', {}).get('total_leads', 0),
-                    f"{stats.get('overall', {}).get('average_score', 0):.1f}",
-                    "12.5%",  # Placeholder
-                    "8.3%"   # Placeholder
-                ]
-            }
-            
-            df_metrics = pd.DataFrame(metrics_data)
-            st.dataframe(df_metrics, use_container_width=True, hide_index=True)
-            st.markdown("</div>", unsafe_allow_html=True)
+            with st.container(border=True):
+                st.subheader("📊 Performance Metrics")
+                
+                metrics_data = {
+                    "Metric": ["Total Leads", "Avg. Score", "Conversion Rate", "Response Rate"],
+                    "Value": [
+                        stats.get('overall', {}).get('total_leads', 0),
+                        f"{stats.get('overall', {}).get('average_score', 0):.1f}",
+                        "12.5%",  # Placeholder
+                        "8.3%"   # Placeholder
+                    ]
+                }
+                
+                df_metrics = pd.DataFrame(metrics_data)
+                st.dataframe(df_metrics, use_container_width=True, hide_index=True)
         
         with col2:
-            st.markdown("<div class='modern-card'>", unsafe_allow_html=True)
-            st.subheader("🏆 Top Performing Cities")
-            
-            top_cities = stats.get('top_cities', [])
-            if top_cities:
-                df_cities = pd.DataFrame(top_cities)
-                df_cities = df_cities.head(5)
+            with st.container(border=True):
+                st.subheader("🏆 Top Performing Cities")
                 
-                fig_cities = px.bar(
-                    df_cities,
-                    x='city',
-                    y='lead_count',
-                    color='avg_score',
-                    color_continuous_scale='viridis',
-                    text='lead_count'
-                )
-                fig_cities.update_layout(
-                    height=300,
-                    showlegend=False
-                )
-                st.plotly_chart(fig_cities, use_container_width=True)
-            else:
-                st.info("No city data available yet.")
-            st.markdown("</div>", unsafe_allow_html=True)
+                top_cities = stats.get('top_cities', [])
+                if top_cities:
+                    df_cities = pd.DataFrame(top_cities)
+                    df_cities = df_cities.head(5)
+                    
+                    fig_cities = px.bar(
+                        df_cities,
+                        x='city',
+                        y='lead_count',
+                        color='avg_score',
+                        color_continuous_scale='viridis',
+                        text='lead_count'
+                    )
+                    fig_cities.update_layout(
+                        height=300,
+                        showlegend=False
+                    )
+                    st.plotly_chart(fig_cities, use_container_width=True)
+                else:
+                    st.info("No city data available yet.")
+    
+    def build_excel_export(self, leads: List[Dict], columns: List[str]) -> Optional[bytes]:
+        """Build the Excel export, streaming rows with xlsxwriter and falling back to openpyxl"""
+        output = io.BytesIO()
+        
+        # Both writers are optional and only loaded when an Excel export is requested
+        try:
+            import xlsxwriter
+            
+            # constant_memory flushes each row as it is written instead of keeping the sheet in memory
+            workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+            worksheet = workbook.add_worksheet("Leads")
+            header_format = workbook.add_format({"bold": True, "font_color": "#FFFFFF", "bg_color": "#0066FF"})
+            
+            worksheet.write_row(0, 0, columns, header_format)
+            for row_number, lead in enumerate(leads, start=1):
+                worksheet.write_row(row_number, 0, [lead.get(col) for col in columns])
+            
+            workbook.close()
+            return output.getvalue()
+        except ImportError:
+            pass
+        
+        try:
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import PatternFill, Font
+        except ImportError:
+            return None
+        
+        # Write-only (streaming) workbook with a styled header row
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Leads")
+        header_fill = PatternFill(start_color="0066FF", end_color="0066FF", fill_type="solid")
+        header_font = Font(color="FFFFFF", bold=True)
+        
+        header_cells = []
+        for col in columns:
+            cell = WriteOnlyCell(worksheet, value=col)
+            cell.fill = header_fill
+            cell.font = header_font
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        
+        for lead in leads:
+            worksheet.append([lead.get(col) for col in columns])
+        
+        workbook.save(output)
+        return output.getvalue()
     
     def render_export(self):
         """Render export page"""
         st.title("📤 Export Data")
-        st.markdown("<p class='subtitle'>Export your leads in various formats</p>", unsafe_allow_html=True)
+        render_html(PAGE_SUBTITLES["export"])
         
         # Export configuration
         col1, col2 = st.columns(2)
@@ -4487,7 +5605,7 @@ class UltimateStreamlitDashboard:
             # Quick filter presets
             preset = st.selectbox(
                 "Quick Presets",
-                ["All Leads", "High Intent Only", "Premium Leads", "No Website", "Active Leads"]
+                list(EXPORT_PRESET_FILTERS)
             )
             
             # Date range
@@ -4498,171 +5616,148 @@ class UltimateStreamlitDashboard:
                 date_to = st.date_input("To Date")
         
         # Apply filters based on preset
-        filters = {}
-        
-        if preset == "High Intent Only":
-            filters["website_status"] = ["no_website", "broken", "parked"]
-        elif preset == "Premium Leads":
-            filters["quality_tier"] = ["Premium", "High"]
-        elif preset == "No Website":
-            filters["website_status"] = ["no_website"]
-        elif preset == "Active Leads":
-            filters["lead_status"] = ["New Lead", "Contacted", "Follow Up"]
+        filters = dict(EXPORT_PRESET_FILTERS[preset])
         
         if date_from:
             filters["date_from"] = date_from.isoformat()
         if date_to:
             filters["date_to"] = date_to.isoformat()
         
-        # Get filtered data
-        leads_data = self.crm.get_leads(filters=filters, page=1, per_page=10000)
+        # Get filtered data (cached per filter set until the database changes)
+        leads_data = cached_get_leads(make_filters_key(filters), 1, 10000, get_db_version())
         leads = leads_data["leads"]
         
         st.metric("Leads to Export", len(leads))
         
-        if leads:
-            # Create dataframe with selected fields
-            df = pd.DataFrame(leads)
-            
-            # Filter columns
-            available_cols = [col for col in selected_fields if col in df.columns]
-            df_export = df[available_cols]
-            
-            # Preview
-            with st.expander("👁️ Preview Data"):
-                st.dataframe(df_export.head(10), use_container_width=True)
-            
-            # Export buttons
-            st.subheader("Download")
-            
-            if export_format == "CSV":
-                csv_data = df_export.to_csv(index=False)
-                st.download_button(
-                    label="📥 Download CSV",
-                    data=csv_data,
-                    file_name=f"leads_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    use_container_width=True
-                )
-            
-            elif export_format == "Excel":
-                # Create Excel file with styling
-                output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                    df_export.to_excel(writer, index=False, sheet_name='Leads')
-                    
-                    # Get workbook and worksheet
-                    workbook = writer.book
-                    worksheet = writer.sheets['Leads']
-                    
-                    # Apply some basic styling
-                    header_fill = PatternFill(start_color="0066FF", end_color="0066FF", fill_type="solid")
-                    header_font = Font(color="FFFFFF", bold=True)
-                    
-                    for cell in worksheet[1]:
-                        cell.fill = header_fill
-                        cell.font = header_font
-                
-                st.download_button(
-                    label="📥 Download Excel",
-                    data=output.getvalue(),
-                    file_name=f"leads_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    type="primary",
-                    use_container_width=True
-                )
-            
-            elif export_format == "JSON":
-                json_data = df_export.to_json(orient="records", indent=2)
-                st.download_button(
-                    label="📥 Download JSON",
-                    data=json_data,
-                    file_name=f"leads_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json",
-                    type="primary",
-                    use_container_width=True
-                )
-        else:
+        if not leads:
             st.warning("No leads to export with the current filters.")
+            return
+        
+        # Filter columns against the fields the leads actually carry
+        available_cols = [col for col in selected_fields if col in leads[0]]
+        if not available_cols:
+            st.warning("Select at least one field to export.")
+            return
+        
+        # Preview: only the first rows, projected column-wise to the selected fields
+        preview_leads = leads[:10]
+        with st.expander("👁️ Preview Data"):
+            st.dataframe(
+                {col: [lead.get(col) for lead in preview_leads] for col in available_cols},
+                use_container_width=True
+            )
+        
+        # Export buttons
+        st.subheader("Download")
+        
+        if export_format == "CSV":
+            csv_buffer = io.StringIO()
+            csv_writer = csv.writer(csv_buffer, lineterminator="\n")
+            csv_writer.writerow(available_cols)
+            csv_writer.writerows([lead.get(col) for col in available_cols] for lead in leads)
+            csv_data = csv_buffer.getvalue().encode("utf-8")
+            st.download_button(
+                label="📥 Download CSV",
+                data=csv_data,
+                file_name=f"leads_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv",
+                type="primary",
+                use_container_width=True
+            )
+        
+        elif export_format == "Excel":
+            excel_data = self.build_excel_export(leads, available_cols)
+            if excel_data is None:
+                st.error("Excel export requires xlsxwriter or openpyxl: pip install xlsxwriter")
+                return
+            
+            st.download_button(
+                label="📥 Download Excel",
+                data=excel_data,
+                file_name=f"leads_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                type="primary",
+                use_container_width=True
+            )
+        
+        elif export_format == "JSON":
+            json_data = json_dumps(
+                [{col: lead.get(col) for col in available_cols} for lead in leads],
+                indent=True
+            )
+            st.download_button(
+                label="📥 Download JSON",
+                data=json_data,
+                file_name=f"leads_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                mime="application/json",
+                type="primary",
+                use_container_width=True
+            )
     
     def render_logs(self):
         """Render logs page"""
         st.title("📋 System Logs")
-        st.markdown("<p class='subtitle'>Monitor system activity and errors</p>", unsafe_allow_html=True)
+        render_html(PAGE_SUBTITLES["logs"])
         
-        # Log viewer
-        log_viewer = EnhancedLogger()
-        recent_logs = log_viewer.get_recent_logs(limit=100)
+        # Log viewer (shares the module logger; a new EnhancedLogger would re-attach handlers)
+        recent_logs, level_index, messages_lower = cached_recent_logs(100, get_log_version())
         
-        if recent_logs:
-            # Filter options
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                log_level = st.selectbox(
-                    "Filter by Level",
-                    ["All", "INFO", "WARNING", "ERROR", "DEBUG"]
-                )
-            
-            with col2:
-                search_term = st.text_input("Search in logs")
-            
-            with col3:
-                auto_refresh = st.checkbox("Auto-refresh (10s)", value=False)
-            
-            # Apply filters
-            filtered_logs = recent_logs
-            
-            if log_level != "All":
-                filtered_logs = [log for log in filtered_logs if log["level"] == log_level]
-            
-            if search_term:
-                filtered_logs = [log for log in filtered_logs if search_term.lower() in log["message"].lower()]
-            
-            # Display logs
-            st.subheader(f"Log Entries ({len(filtered_logs)})")
-            
-            for log in reversed(filtered_logs):  # Show newest first
-                with st.container():
-                    col1, col2 = st.columns([4, 1])
-                    
-                    with col1:
-                        # Color code by level
-                        level_colors = {
-                            "INFO": "#3B82F6",
-                            "WARNING": "#F59E0B",
-                            "ERROR": "#EF4444",
-                            "DEBUG": "#6B7280"
-                        }
-                        
-                        level_color = level_colors.get(log["level"], "#6B7280")
-                        
-                        st.markdown(f"""
-                        <div style="padding: 0.5rem; border-left: 4px solid {level_color}; margin-bottom: 0.5rem;">
-                            <strong>{log['level']}</strong>: {log['message']}
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    with col2:
-                        st.caption(log['timestamp'])
-                    
-                    st.divider()
-            
-            # Clear logs button
-            if st.button("🗑️ Clear All Logs", type="secondary"):
-                if os.path.exists(CONFIG.storage["logs_file"]):
-                    with open(CONFIG.storage["logs_file"], "w") as f:
-                        f.write("")
-                    st.success("Logs cleared!")
-                    st.rerun()
-        else:
+        if not recent_logs:
             st.info("No logs available yet.")
+            return
+        
+        # Filter options
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            log_level = st.selectbox(
+                "Filter by Level",
+                ["All", "INFO", "WARNING", "ERROR", "DEBUG"]
+            )
+        
+        with col2:
+            search_term = st.text_input("Search in logs")
+        
+        with col3:
+            auto_refresh = st.checkbox("Auto-refresh (10s)", value=False)
+        
+        # Apply filters
+        positions = level_index.get(log_level, []) if log_level != "All" else range(len(recent_logs))
+        
+        if search_term:
+            needle = search_term.lower()
+            positions = [position for position in positions if needle in messages_lower[position]]
+        
+        # Display logs
+        st.subheader(f"Log Entries ({len(positions)})")
+        
+        shown_logs = (recent_logs[position] for position in islice(reversed(positions), 100))  # Show newest first
+        logs_html = "".join(
+            LOG_ENTRY_TEMPLATE % (
+                # Color code by level; unexpected levels get a gray opener built on the fly
+                LOG_ENTRY_OPENERS.get(log["level"])
+                or LOG_ENTRY_OPEN_TEMPLATE.format(color="#6B7280", level=html.escape(log["level"])),
+                log['message_html'],
+                log['timestamp']
+            )
+            for log in shown_logs
+        )
+        
+        if logs_html:
+            render_html(logs_html)
+        
+        # Clear logs button
+        if st.button("🗑️ Clear All Logs", type="secondary"):
+            if os.path.exists(CONFIG.storage["logs_file"]):
+                with open(CONFIG.storage["logs_file"], "w") as f:
+                    f.write("")
+                st.success("Logs cleared!")
+                st.rerun()
     
     def render_automation(self):
         """Render automation page"""
         st.title("🔄 Automation Rules")
-        st.markdown("<p class='subtitle'>Automate lead processing and follow-ups</p>", unsafe_allow_html=True)
+        render_html(PAGE_SUBTITLES["automation"])
         
         # Automation rules configuration
         with st.expander("🤖 AI-Powered Automation Rules", expanded=True):
@@ -4719,35 +5814,45 @@ class UltimateStreamlitDashboard:
             page = self.render_sidebar()
             
             # Render selected page
-            if page == "dashboard":
-                self.render_dashboard()
-            elif page == "leads":
-                self.render_leads_management()
-            elif page == "lead_details":
-                self.render_lead_details_page()
-            elif page == "settings":
-                self.render_settings()
-            elif page == "analytics":
-                self.render_analytics()
-            elif page == "export":
-                self.render_export()
-            elif page == "logs":
-                self.render_logs()
-            elif page == "automation":
-                self.render_automation()
-            
-            # Auto-refresh if scraper is running
-            if st.session_state.get('scraper_running') and AUTOREFRESH_AVAILABLE:
-                st_autorefresh(interval=10000, limit=100, key="dashboard_refresh")
+            page_renderers = {
+                "dashboard": self.render_dashboard,
+                "leads": self.render_leads_management,
+                "lead_details": self.render_lead_details_page,
+                "settings": self.render_settings,
+                "analytics": self.render_analytics,
+                "export": self.render_export,
+                "logs": self.render_logs,
+                "automation": self.render_automation
+            }
+            render_page = page_renderers.get(page)
+            if render_page:
+                render_page()
+            
+            # Auto-refresh if scraper is running; back off while neither leads nor logs change
+            if self.runner.is_running() and AUTOREFRESH_AVAILABLE:
+                st_autorefresh(interval=self.get_refresh_interval(), limit=100, key="dashboard_refresh")
             
         except Exception as e:
             logger.log(f"Dashboard error: {e}", "ERROR")
             st.error(f"An error occurred: {str(e)}")
     
+    def get_refresh_interval(self) -> int:
+        """Pick the autorefresh interval (ms): fast after a change, slow while idle"""
+        signature = (get_db_version(), get_log_version())
+        changed = st.session_state.get('refresh_signature') != signature
+        st.session_state.refresh_signature = signature
+        return REFRESH_INTERVAL_ACTIVE_MS if changed else REFRESH_INTERVAL_IDLE_MS
+    
     def render_lead_details_page(self):
         """Render standalone lead details page"""
         st.title("🔍 Lead Details")
         
+        # Deep link: ?lead_id=<id> preselects the lead once per session
+        linked_lead_id = get_query_param("lead_id")
+        if linked_lead_id and linked_lead_id.isdigit() and not st.session_state.get('lead_id_linked'):
+            st.session_state.lead_id_linked = True
+            st.session_state.selected_lead_id = int(linked_lead_id)
+        
         # Lead ID input
         col1, col2 = st.columns([3, 1])
         
@@ -4765,7 +5870,7 @@ class UltimateStreamlitDashboard:
         
         # Load and display lead
         if st.session_state.get('selected_lead_id'):
-            lead = self.crm.get_lead_by_id(st.session_state.selected_lead_id)
+            lead = cached_lead_by_id(st.session_state.selected_lead_id, get_db_version())
             
             if lead:
                 self.render_lead_detail_view(lead)
@@ -4869,23 +5974,27 @@ def export_leads(format: str):
         print("❌ No leads to export")
         return
     
-    df = pd.DataFrame(leads)
-    
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     if format == "csv":
         filename = f"leads_export_{timestamp}.csv"
-        df.to_csv(filename, index=False)
+        with open(filename, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(leads[0]), extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(leads)
         print(f"✅ Exported {len(leads)} leads to {filename}")
     
     elif format == "json":
         filename = f"leads_export_{timestamp}.json"
-        df.to_json(filename, orient="records", indent=2)
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(json_dumps(leads, indent=True))
         print(f"✅ Exported {len(leads)} leads to {filename}")
     
     elif format == "excel":
+        import pandas as pd
+        
         filename = f"leads_export_{timestamp}.xlsx"
-        df.to_excel(filename, index=False)
+        pd.DataFrame(leads).to_excel(filename, index=False)
         print(f"✅ Exported {len(leads)} leads to {filename}")
 
 def show_statistics():
@@ -4932,6 +6041,7 @@ def run_cli_scraper(mode: str, cycles: int):
     
     finally:
         scraper.stop()
+        scraper.save_cache(force=True)
         
         print("\n📊 Final Statistics:")
         print(f"Total Cycles: {scraper.stats['total_cycles']}")